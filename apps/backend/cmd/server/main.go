@@ -234,6 +234,9 @@ func main() {
 	// Recovery middleware
 	router.Use(gin.Recovery())
 
+	// Accept gzip-compressed request bodies (scanner ingestion)
+	router.Use(middleware.GzipRequestBody())
+
 	// Rate limiting middleware
 	rateLimiter := middleware.APIRateLimiter()
 	if rateLimiter != nil {
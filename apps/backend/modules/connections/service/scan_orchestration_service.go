@@ -144,6 +144,7 @@ func (s *ScanOrchestrationService) processJobs() {
 		"--connection", "config/connection.yml",
 		"--fingerprint", "../../fingerprint.yml",
 		"--ingest-url", "http://localhost:8080/api/v1/scans/ingest-verified",
+		"--ingest-gzip",
 		"--quiet") // Use --quiet to suppress table output
 
 	// Set working directory to apps/scanner (relative to apps/backend)
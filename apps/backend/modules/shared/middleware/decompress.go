@@ -0,0 +1,40 @@
+package middleware
+
+import (
+	"compress/gzip"
+	"net/http"
+	"strings"
+
+	"github.com/gin-gonic/gin"
+)
+
+// maxDecompressedBodyBytes caps how large a gzip request body may inflate to
+// Guards against decompression bombs on large ingestion payloads
+const maxDecompressedBodyBytes = 512 << 20
+
+// GzipRequestBody transparently decompresses request bodies sent with Content-Encoding: gzip
+// Lets the scanner compress large ingestion payloads; handlers still see plain JSON
+func GzipRequestBody() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		if !strings.EqualFold(c.GetHeader("Content-Encoding"), "gzip") {
+			c.Next()
+			return
+		}
+
+		reader, err := gzip.NewReader(c.Request.Body)
+		if err != nil {
+			c.AbortWithStatusJSON(http.StatusBadRequest, gin.H{
+				"error":   "Invalid gzip request body",
+				"details": err.Error(),
+			})
+			return
+		}
+		defer reader.Close()
+
+		c.Request.Body = http.MaxBytesReader(c.Writer, reader, maxDecompressedBodyBytes)
+		c.Request.Header.Del("Content-Encoding")
+		c.Request.ContentLength = -1
+
+		c.Next()
+	}
+}
@@ -13,6 +13,18 @@ Algorithm:
 Reference: https://en.wikipedia.org/wiki/Verhoeff_algorithm
 """
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, uint8, int64
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Multiplication table (dihedral group D5)
 MULTIPLICATION_TABLE = [
     [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
@@ -42,6 +54,102 @@ PERMUTATION_TABLE = [
 # Inverse table
 INVERSE_TABLE = [0, 4, 3, 2, 1, 5, 6, 7, 8, 9]
 
+# Fused 800-byte transition table: FUSED[pos*100 + checksum*10 + d] = MULT[checksum][PERM[pos][d]]
+# One lookup per digit instead of two dependent ones; indexing bytes yields ints directly
+_FUSED_BYTES = bytes(
+    MULTIPLICATION_TABLE[checksum][PERMUTATION_TABLE[pos][digit]]
+    for pos in range(8) for checksum in range(10) for digit in range(10)
+)
+
+# SWAR constants for checking 8 ASCII digits ('0'-'9' = 0x30-0x39) per 64-bit word
+_HIGH_NIBBLES = 0xF0F0F0F0F0F0F0F0
+_ADD_SIX = 0x0606060606060606
+_ALL_THREES = 0x3333333333333333
+
+
+if NUMPY_AVAILABLE:
+    # Contiguous uint8 tables (100 + 80 bytes) for vectorized and JIT callers
+    _MULT = np.asarray(MULTIPLICATION_TABLE, dtype=np.uint8)
+    _PERM = np.asarray(PERMUTATION_TABLE, dtype=np.uint8)
+    # _FUSED[pos*100 + checksum*10 + d] = _MULT[checksum, _PERM[pos, d]]
+    _FUSED = _MULT[np.arange(10)[None, :, None], _PERM[:, None, :]].ravel()
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles eagerly at import, so the first call pays no JIT cost
+    @njit(uint8(uint8[:], uint8[:], int64), cache=True, boundscheck=False)
+    def _verhoeff_kernel(digits, fused, offset):
+        """Walks digit values right to left and returns the Verhoeff checksum."""
+        checksum = 0
+        last = len(digits) - 1
+        for i in range(last, -1, -1):
+            pos = ((last - i) + offset) & 7
+            checksum = fused[pos * 100 + checksum * 10 + digits[i]]
+        return checksum
+
+
+def _digit_mask_check(b: bytes) -> bool:
+    """
+    Checks that every byte is an ASCII digit, eight bytes at a time.
+
+    Each byte of a digit has high nibble 3, and adding 6 must not carry it
+    to 4 (which would mean a byte above '9').
+
+    Args:
+        b: Bytes to check
+
+    Returns:
+        True if all bytes are ASCII digits, False otherwise
+    """
+    remainder = len(b) % 8
+    if remainder:
+        b = b + b'0' * (8 - remainder)
+
+    for i in range(0, len(b), 8):
+        v = int.from_bytes(b[i:i + 8], 'little')
+        if ((v & _HIGH_NIBBLES) | (((v + _ADD_SIX) & _HIGH_NIBBLES) >> 4)) != _ALL_THREES:
+            return False
+    return True
+
+
+def _encode_digits(number: str):
+    """
+    Encodes a digit string to ASCII bytes.
+
+    Returns:
+        The encoded bytes, or None if number is empty or not all ASCII digits
+    """
+    if not number:
+        return None
+    try:
+        bytes_val = number.encode('ascii')
+    except UnicodeEncodeError:
+        return None
+    return bytes_val if _digit_mask_check(bytes_val) else None
+
+
+def _verhoeff_checksum(bytes_val: bytes, offset: int) -> int:
+    """
+    Computes the Verhoeff checksum of ASCII digit bytes.
+
+    Args:
+        bytes_val: ASCII digit bytes
+        offset: Position offset (0 to validate, 1 to generate a check digit)
+
+    Returns:
+        The checksum value (0-9)
+    """
+    if NUMBA_AVAILABLE:
+        digits = np.frombuffer(bytes_val, dtype=np.uint8) - 48
+        return int(_verhoeff_kernel(digits, _FUSED, offset))
+
+    # Walk indices right to left; no reversed/enumerate objects or int() per digit
+    n = len(bytes_val)
+    checksum = 0
+    for k in range(n):
+        digit_value = bytes_val[n - 1 - k] - 48
+        checksum = _FUSED_BYTES[((k + offset) & 7) * 100 + checksum * 10 + digit_value]
+    return checksum
+
 
 def verhoeff_validate(number: str) -> bool:
     """
@@ -54,26 +162,13 @@ def verhoeff_validate(number: str) -> bool:
         True if valid, False otherwise
     """
     # Input validation
-    if not number:
+    bytes_val = _encode_digits(number)
+    if bytes_val is None:
         return False
     
-    if not number.isdigit():
-        return False
-    
-    # Verhoeff checksum
-    checksum = 0
-    
-    # Process digits from right to left
-    for i, digit in enumerate(reversed(number)):
-        digit_value = int(digit)
-        
-        # Get the permutation based on position
-        # Position is (i % 8) because permutation table has 8 rows
-        permutation_row = i % 8
-        permuted_digit = PERMUTATION_TABLE[permutation_row][digit_value]
-        
-        # Apply multiplication table
-        checksum = MULTIPLICATION_TABLE[checksum][permuted_digit]
+    # Verhoeff checksum, processing digits from right to left
+    # (position is i % 8 because the permutation table has 8 rows)
+    checksum = _verhoeff_checksum(bytes_val, 0)
     
     # Valid if checksum is 0
     return checksum == 0
@@ -89,18 +184,12 @@ def verhoeff_generate_check_digit(number: str) -> str:
     Returns:
         The check digit as a string
     """
-    if not number or not number.isdigit():
+    bytes_val = _encode_digits(number)
+    if bytes_val is None:
         raise ValueError("Input must be a string of digits")
     
-    # Calculate checksum with check digit position
-    checksum = 0
-    
-    # Process from right to left, but position starts at 1 because we're adding a digit
-    for i, digit in enumerate(reversed(number)):
-        digit_value = int(digit)
-        position = (i + 1) % 8  # +1 because we're inserting a check digit at position 0
-        permuted_digit = PERMUTATION_TABLE[position][digit_value]
-        checksum = MULTIPLICATION_TABLE[checksum][permuted_digit]
+    # Position starts at 1 because we're inserting a check digit at position 0
+    checksum = _verhoeff_checksum(bytes_val, 1)
     
     # The check digit is the inverse of the checksum
     check_digit = INVERSE_TABLE[checksum]
@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for the scanner HTTP API.
+Run with: gunicorn -c gunicorn.conf.py scanner_api:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5002)}"
+
+# Import scanner_api (and warm its pattern catalog) once in the master; workers fork
+# with the compiled catalog already in memory and share its pages copy-on-write
+preload_app = True
+
+# active_scans and the scan/ingest pools live in process memory, so /scan and
+# /scan/<id>/status must be served by the same process
+workers = int(os.getenv('WEB_WORKERS', 1))
+
+# Threaded worker: /scan and status polls are served concurrently. gevent is not used
+# since monkey-patching would turn the scan/ingest pools into greenlets on one hub,
+# stalling requests behind CPU-bound regex matching
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', 32))
+
+# Scans run on the API's own pools; requests themselves return immediately
+timeout = 120
@@ -17,8 +17,12 @@ Supported sources:
 - firebase
 """
 
+import os
 import sys
+import functools
+import importlib
 import concurrent.futures
+import multiprocessing
 from typing import List, Dict, Any
 from hawk_scanner.internals import system
 from rich.console import Console
@@ -40,16 +44,27 @@ SUPPORTED_COMMANDS = [
     'couchdb',      # CouchDB databases
 ]
 
+@functools.cache
+def _load_command(command: str):
+    """Import a command module once per process and return its execute()."""
+    return importlib.import_module(f"hawk_scanner.commands.{command}").execute
+
+def _preload_all_commands():
+    """Pool initializer: pay the heavy driver/SDK imports once per worker."""
+    for command in SUPPORTED_COMMANDS:
+        try:
+            _load_command(command)
+        except Exception:
+            # Surfaced per command by execute_single_command
+            pass
+
 def execute_single_command(command: str, args) -> List[Dict[str, Any]]:
     """Execute a single scanner command and return results."""
     try:
         system.print_info(args, f"Starting {command} scan...")
 
-        # Import the command module dynamically
-        module = __import__(f"hawk_scanner.commands.{command}", fromlist=[command])
-
         # Execute the command
-        results = module.execute(args)
+        results = _load_command(command)(args)
 
         system.print_success(args, f"{command} scan completed: {len(results)} findings")
         return results
@@ -59,12 +74,25 @@ def execute_single_command(command: str, args) -> List[Dict[str, Any]]:
         return []
 
 def execute_parallel(args) -> List[Dict[str, Any]]:
-    """Execute all commands in parallel using ThreadPoolExecutor."""
+    """Execute all commands in parallel using a process pool (or threads with --pool=thread)."""
     all_results = []
 
     system.print_info(args, f"Starting parallel scan of all {len(SUPPORTED_COMMANDS)} data sources...")
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(SUPPORTED_COMMANDS)) as executor:
+    # Scanning is CPU-bound regex work, so threads would serialize on the GIL
+    if getattr(args, 'pool', 'process') == 'thread':
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(SUPPORTED_COMMANDS))
+    else:
+        # Never a plain fork: main() may already be running the hawk-warmup thread, and a
+        # child forked while it holds the pattern database lock would deadlock on it
+        methods = multiprocessing.get_all_start_methods()
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(len(SUPPORTED_COMMANDS), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn'),
+            initializer=_preload_all_commands
+        )
+
+    with executor:
         # Submit all tasks
         future_to_command = {
             executor.submit(execute_single_command, command, args): command
@@ -1,24 +1,95 @@
 import argparse
-from google.cloud import storage
 from rich.console import Console
 from hawk_scanner.internals import system
-from hawk_scanner.internals.binary_detection import is_text_file, get_binary_file_stats
+from hawk_scanner.internals.binary_detection import is_text_file
 from hawk_scanner.internals.validation_integration import validate_findings
 import os
+import json
 import concurrent.futures
+import itertools
+import multiprocessing
+import threading
 import time
+from collections import deque
+from dataclasses import dataclass, asdict, fields
+from typing import Optional
 
-def process_file(args, file_path, key, results):
+@dataclass
+class ScanArgs:
+    """Pickle-safe subset of the CLI arguments needed to scan a file in a worker process."""
+    connection: Optional[str] = None
+    connection_json: Optional[str] = None
+    fingerprint: Optional[str] = None
+    quiet: bool = False
+    debug: bool = False
+    verbose: bool = False
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(**{f.name: getattr(args, f.name, f.default) for f in fields(cls)})
+
+    def to_namespace(self):
+        return argparse.Namespace(**asdict(self))
+
+def _init_worker(patterns, pattern_db):
+    # Seed the fingerprint and pattern database caches so workers don't reload/re-download
+    # the catalog or recompile the Hyperscan database
+    system._fingerprint_cache = patterns
+    system._pattern_db_cache = (patterns, pattern_db)
+
+def _scan_file(task):
+    file_path, key, scan_args = task
+    return process_file(scan_args.to_namespace(), file_path, key)
+
+# Files per submitted task, and tasks kept in flight per worker
+SCAN_CHUNK_SIZE = 64
+IN_FLIGHT_PER_WORKER = 2
+
+def _scan_files(tasks):
+    return [_scan_file(task) for task in tasks]
+
+def _bounded_map(pool, workers, tasks, deadline=None):
+    """
+    Yields _scan_file(task) for each task, in order, keeping at most a few chunks in flight.
+
+    Executor.map submits every task before yielding anything, which would walk the whole
+    tree up front. Here the walk advances one chunk at a time as results are consumed.
+    Raises concurrent.futures.TimeoutError once the monotonic deadline has passed.
+    """
+    tasks = iter(tasks)
+    in_flight = deque()
+    try:
+        while True:
+            while len(in_flight) < workers * IN_FLIGHT_PER_WORKER:
+                chunk = list(itertools.islice(tasks, SCAN_CHUNK_SIZE))
+                if not chunk:
+                    break
+                in_flight.append(pool.submit(_scan_files, chunk))
+            if not in_flight:
+                return
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise concurrent.futures.TimeoutError()
+            yield from in_flight.popleft().result(timeout=remaining)
+    finally:
+        # Abandoned or timed out: drop chunks that haven't started
+        for future in in_flight:
+            future.cancel()
+
+def process_file(args, file_path, key):
+    """Scan one file, returning (status, results) where status is 'text' or 'binary'."""
+    results = []
     if not is_text_file(file_path):
         if hasattr(args, 'verbose') and args.verbose:
             system.print_info(args, f"Skipped binary file: {file_path}")
-        return
+        return 'binary', results
     
     matches = system.read_match_strings(args, file_path, 'fs')
-    file_data = system.getFileData(file_path)
     if matches:
         validated_matches = validate_findings(matches, args)
         if validated_matches:
+            # Only files with findings need their metadata
+            file_data = system.getFileData(file_path)
             for match in validated_matches:
                 results.append({
                     'host': 'This PC',
@@ -32,49 +103,125 @@ def process_file(args, file_path, key, results):
                     'validation_method': match.get('validation_method', {}),
                     'validated': True
                 })
+    return 'text', results
 
 def execute(args):
-    results = []
+    return list(iter_results(args))
+
+def scan_iter(connections, fingerprint=None, quiet=True, debug=False, timeout=None):
+    """
+    Scans the fs sources of a connection dict in-process, yielding each finding as its file is scanned.
+
+    Lets callers such as scanner_api skip the CLI, the YAML connection file and the JSON report.
+    Files are scanned on a process pool shared by every scan in this process, so concurrent
+    scans run on separate cores without each starting its own workers. Raises TimeoutError
+    once the scan runs longer than timeout seconds.
+    """
+    args = argparse.Namespace(command='fs', connection=None, connection_json=json.dumps(connections),
+                              fingerprint=fingerprint, quiet=quiet, debug=debug, verbose=False)
+    pool = shared_process_pool(args)
+    try:
+        yield from iter_results(args, timeout=timeout, process_pool=pool)
+    except concurrent.futures.BrokenExecutor:
+        # A worker died; the next scan starts a fresh pool
+        with _shared_pools_lock:
+            if _shared_pools.get(fingerprint) is pool:
+                del _shared_pools[fingerprint]
+        raise
+
+def _process_pool(args):
+    """
+    Pool of scan worker processes seeded with the fingerprint catalog and pattern database.
+
+    Workers come from a forkserver (spawn where unavailable), never a plain fork: the parent
+    may already run other threads (hawk-warmup, or a host such as scanner_api) whose locks a
+    forked child would inherit mid-use.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    patterns = system.get_fingerprint_file(args)
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(patterns, system.get_pattern_db(patterns))
+    )
+
+# Long-lived pools for in-process callers, one per fingerprint file, created on first use
+_shared_pools = {}
+_shared_pools_lock = threading.Lock()
+
+def shared_process_pool(args):
+    """Returns the process-wide scan pool for args.fingerprint."""
+    with _shared_pools_lock:
+        pool = _shared_pools.get(args.fingerprint)
+        if pool is None:
+            pool = _shared_pools[args.fingerprint] = _process_pool(args)
+        return pool
+
+def iter_results(args, timeout=None, process_pool=None):
+    """
+    Yields the findings of every fs profile.
+
+    timeout is a wall-clock limit in seconds for the whole scan. A caller-supplied
+    process_pool is used for every non-thread profile and left running afterwards.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
     connections = system.get_connection(args)
     if 'sources' in connections:
         sources_config = connections['sources']
         fs_config = sources_config.get('fs')
         if fs_config:
-            for key, config in fs_config.items():
-                if 'path' not in config:
-                    system.print_error(args, f"Path not found in fs profile '{key}'")
-                    continue
-                path = config.get('path')
-                if not os.path.exists(path):
-                    system.print_error(args, f"Path '{path}' does not exist")
-                
-                exclude_patterns = fs_config.get(key, {}).get('exclude_patterns', [])
-                start_time = time.time()
-                ## CHECK If file or directory
-                if os.path.isfile(path):
-                    files = [path]
-                else:
-                    # Convert generator to list to allow len() operations
-                    files = list(system.list_all_files_iteratively(args, path, exclude_patterns))
-                
-                # NEW: Analyze binary vs text files
-                file_stats = get_binary_file_stats(files)
-                system.print_info(args, f"File analysis: {file_stats['text']} text files, {file_stats['binary']} binary files skipped")
-                
-                # Use ThreadPoolExecutor for parallel processing
-                file_count = 0
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    futures = []
-                    for file_path in files:
-                        file_count += 1
-                        futures.append(executor.submit(process_file, args, file_path, key, results))
+            # One process pool (the caller's, or created on first use) shared by every profile
+            own_pool = process_pool is None
+            try:
+                for key, config in fs_config.items():
+                    if 'path' not in config:
+                        system.print_error(args, f"Path not found in fs profile '{key}'")
+                        continue
+                    path = config.get('path')
+                    if not os.path.exists(path):
+                        system.print_error(args, f"Path '{path}' does not exist")
+                    
+                    exclude_patterns = fs_config.get(key, {}).get('exclude_patterns', [])
+                    start_time = time.time()
+                    ## CHECK If file or directory
+                    if os.path.isfile(path):
+                        files = [path]
+                    else:
+                        # Walked lazily, a chunk at a time, as the executor takes files
+                        files = system.list_all_files_iteratively(args, path, exclude_patterns)
+                    
+                    # Regex matching and validation are CPU-bound, so use processes by default;
+                    # 'executor: thread' suits IO-bound paths such as network mounts
+                    if config.get('executor', 'process') == 'thread':
+                        workers = min(32, (os.cpu_count() or 1) + 4)
+                        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+                    else:
+                        if process_pool is None:
+                            process_pool = _process_pool(args)
+                        workers = os.cpu_count() or 1
+                        pool = process_pool
                     
-                    # Wait for all tasks to complete
-                    concurrent.futures.wait(futures)
-                end_time = time.time()
-                system.print_info(args, f"Time taken to analyze {file_stats['text']} text files: {end_time - start_time} seconds")
+                    scan_args = ScanArgs.from_args(args)
+                    file_stats = {'text': 0, 'binary': 0}
+                    try:
+                        tasks = ((file_path, key, scan_args) for file_path in files)
+                        for status, file_results in _bounded_map(pool, workers, tasks, deadline):
+                            file_stats[status] += 1
+                            yield from file_results
+                    except concurrent.futures.TimeoutError:
+                        raise TimeoutError(f"fs scan exceeded its {timeout}s time limit") from None
+                    finally:
+                        if pool is not process_pool:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                    system.print_info(args, f"File analysis: {file_stats['text']} text files, {file_stats['binary']} binary files skipped")
+                    end_time = time.time()
+                    system.print_info(args, f"Time taken to analyze {file_stats['text']} text files: {end_time - start_time} seconds")
+            finally:
+                if own_pool and process_pool is not None:
+                    process_pool.shutdown(wait=False, cancel_futures=True)
         else:
             system.print_error(args, "No filesystem 'fs' connection details found in connection.yml")
     else:
         system.print_error(args, "No 'sources' section found in connection.yml")
-    return results
@@ -1,3 +1,6 @@
+import functools
+import re
+import sys
 import psycopg2
 from hawk_scanner.internals import system
 from hawk_scanner.internals.validation_integration import validate_findings
@@ -20,105 +23,303 @@ def connect_postgresql(args, host, port, user, password, database):
     except Exception as e:
         system.print_error(args, f"Failed to connect to PostgreSQL database at {host} with error: {e}")
 
-def check_data_patterns(args, conn, patterns, profile_name, database_name, limit_start=0, limit_end=None, whitelisted_tables=None, schemas=None):
+# AUTO-EXCLUDE: ARC-Hawk system tables and common framework tables
+# This prevents scanning the platform's own metadata tables
+EXCLUDED_TABLES = frozenset({
+    # ARC-Hawk platform tables (don't scan our own scan results!)
+    'patterns', 'findings', 'assets', 'classifications',
+    'asset_relationships', 'review_states', 'scan_runs',
+    # Common migration/framework tables
+    'schema_migrations', 'goose_db_version', 'flyway_schema_history',
+    'knex_migrations', 'knex_migrations_lock',
+    # PostgreSQL extension tables
+    'pg_stat_statements', 'spatial_ref_sys',
+})
+
+# Column types that can hold PII; temporal, boolean, uuid and small numeric columns are never scanned
+TEXT_COLUMN_TYPES = {'text', 'character varying', 'character', 'json', 'jsonb'}
+TEXT_COLUMN_UDTS = {'citext'}
+# Phone, Aadhaar and card numbers are often stored as numbers; anything holding 10+ digits is scanned
+NUMERIC_COLUMN_TYPES = {'bigint', 'numeric'}
+MIN_NUMERIC_PRECISION = 10
+
+# json/jsonb arrive as the server's text instead of being parsed into dicts and str()'d back
+JSON_AS_TEXT = psycopg2.extensions.new_type((114, 3802), 'HAWK_JSON_AS_TEXT', lambda value, cursor: value)
+
+# Python regex constructs with no PostgreSQL ARE equivalent
+_UNSUPPORTED_REGEX = re.compile(r'\(\?P|\(\?#|.\(\?[aiLmsux]')
+
+# Python's \d and \s match str.isdecimal()/str.isspace() characters (re uses the same tables)
+_CLASS_PREDICATES = {'d': str.isdecimal, 's': str.isspace}
+
+@functools.lru_cache(maxsize=None)
+def _unicode_class_ranges(escape):
+    """Bracket-expression ranges for every character Python's \\d or \\s matches."""
+    predicate = _CLASS_PREDICATES[escape]
+    ranges = []
+    for code in range(sys.maxunicode + 1):
+        if not predicate(chr(code)):
+            continue
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return ''.join(chr(lo) if lo == hi else f'{chr(lo)}-{chr(hi)}' for lo, hi in ranges)
+
+def _to_postgres_regex(regex):
+    """
+    Translate a Python regex to a PostgreSQL ARE, or None if it can't be pushed down.
+
+    PostgreSQL's class escapes and \\y follow the database's ctype locale (ASCII
+    only under C), while Python's are Unicode-aware, so none are passed through.
+    \\d, \\s and their negations are spelled out as explicit Unicode ranges, \\w
+    and \\W become '.' and \\b/\\B are dropped, which only widens the filter.
+    Scanning is line-based, so '.' (no newlines under (?n)) is wide enough.
+    """
+    if regex.startswith('(?i)'):
+        regex = regex[4:]
+    if _UNSUPPORTED_REGEX.search(regex):
+        return None
+    translated = []
+    class_start = None
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == '\\' and i + 1 < len(regex):
+            escape = regex[i + 1]
+            if escape in 'ds':
+                ranges = _unicode_class_ranges(escape)
+                translated.append(ranges if class_start is not None else f'[{ranges}]')
+            elif escape in 'DSwWbB':
+                if class_start is not None:
+                    return None
+                if escape in 'DS':
+                    translated.append(f'[^{_unicode_class_ranges(escape.lower())}]')
+                elif escape in 'wW':
+                    translated.append('.')
+            else:
+                translated.append(regex[i:i + 2])
+            i += 2
+            continue
+        if class_start is None:
+            if char == '[':
+                class_start = i + 1
+                if regex.startswith('^', class_start):
+                    class_start += 1
+        elif char == ']' and i > class_start:
+            # A ']' straight after '[' or '[^' is a literal
+            class_start = None
+        translated.append(char)
+        i += 1
+    return ''.join(translated)
+
+def build_pushdown_regex(patterns):
+    """
+    Combine fingerprint patterns into one case-insensitive PostgreSQL regex.
+
+    Returns None when any pattern can't be translated, since the filter must
+    match every row the Python scanner could flag.
+    """
+    translated = []
+    for regex in (patterns or {}).values():
+        pg_regex = _to_postgres_regex(regex)
+        if pg_regex is None:
+            return None
+        translated.append(f'(?:{pg_regex})')
+    if not translated:
+        return None
+    # (?n): newline-sensitive, so ^/$ match per line like the line-based scanner
+    return '(?n)' + '|'.join(translated)
+
+def _is_scannable_column(data_type, udt_name, numeric_precision):
+    if data_type in TEXT_COLUMN_TYPES or udt_name in TEXT_COLUMN_UDTS:
+        return True
+    # Unconstrained numeric has no precision and can hold any number of digits
+    return data_type in NUMERIC_COLUMN_TYPES and (numeric_precision is None or numeric_precision >= MIN_NUMERIC_PRECISION)
+
+def _get_scan_columns(args, cursor, schema_clause, schema_params):
+    """Map (schema, table) to its scannable columns with one information_schema query."""
+    cursor.execute(f"""
+        SELECT table_schema, table_name, column_name, data_type, udt_name, numeric_precision
+        FROM information_schema.columns
+        WHERE {schema_clause}
+        ORDER BY table_schema, table_name, ordinal_position
+    """, schema_params)
+    scan_columns = {}
+    for schema, table, name, data_type, udt_name, numeric_precision in cursor.fetchall():
+        if _is_scannable_column(data_type, udt_name, numeric_precision):
+            scan_columns.setdefault((schema, table), []).append(name)
+        else:
+            system.print_debug(args, f"Not scanning \"{schema}\".\"{table}\".\"{name}\" ({data_type})")
+    return scan_columns
+
+def check_data_patterns(args, conn, patterns, profile_name, database_name, limit_start=0, limit_end=None, whitelisted_tables=None, schemas=None, statement_timeout=None, exact_row_counts=False, sample_percent=None, sample_threshold_rows=1_000_000, pushdown_filter=False):
     cursor = conn.cursor()
     
+    # Bound runaway scan queries (milliseconds)
+    if statement_timeout:
+        cursor.execute("SET statement_timeout = %s", (int(statement_timeout),))
+        # Commit so a later rollback doesn't revert the setting
+        conn.commit()
+    
+    # Server-side filtering is opt-in: PostgreSQL regex semantics still vary with
+    # the database's locale and encoding, so some rows could be filtered out unseen
+    pushdown_regex = build_pushdown_regex(patterns) if pushdown_filter else None
+    if pushdown_regex is not None:
+        # Compile the filter once up front; named cursors only surface errors on FETCH
+        try:
+            cursor.execute("SELECT '' ~* %s", (pushdown_regex,))
+        except psycopg2.Error as e:
+            conn.rollback()
+            system.print_debug(args, f"PostgreSQL rejected the pattern filter: {e}")
+            pushdown_regex = None
+    if pushdown_filter and pushdown_regex is None:
+        system.print_info(args, "ℹ️  Some patterns can't run in PostgreSQL - scanning tables without server-side filtering")
+    
     # Determine schemas to scan
     if schemas:
         # User specified schemas
         schema_list = schemas if isinstance(schemas, list) else [schemas]
-        schema_clause = f"table_schema IN ({','.join(['%s'] * len(schema_list))})"
-        cursor.execute(f"SELECT table_schema, table_name FROM information_schema.tables WHERE {schema_clause}", schema_list)
+        schema_clause = "table_schema = ANY(%s)"
+        schema_params = [schema_list]
     else:
         # Scan all user schemas (exclude system schemas)
-        cursor.execute("""
-            SELECT table_schema, table_name 
-            FROM information_schema.tables 
-            WHERE table_schema NOT IN ('pg_catalog', 'information_schema')
-        """)
+        schema_clause = "table_schema NOT IN ('pg_catalog', 'information_schema')"
+        schema_params = []
     
+    # Filter out excluded tables in the catalog query itself
+    excluded_tables = list(EXCLUDED_TABLES)
+    cursor.execute(f"""
+        SELECT table_schema, table_name
+        FROM information_schema.tables
+        WHERE {schema_clause} AND lower(table_name) <> ALL(%s)
+    """, schema_params + [excluded_tables])
     all_tables = [(row[0], row[1]) for row in cursor.fetchall()]
     
-    # AUTO-EXCLUDE: ARC-Hawk system tables and common framework tables
-    # This prevents scanning the platform's own metadata tables
-    EXCLUDED_TABLES = {
-        # ARC-Hawk platform tables (don't scan our own scan results!)
-        'patterns', 'findings', 'assets', 'classifications',
-        'asset_relationships', 'review_states', 'scan_runs',
-        # Common migration/framework tables
-        'schema_migrations', 'goose_db_version', 'flyway_schema_history',
-        'knex_migrations', 'knex_migrations_lock',
-        # PostgreSQL extension tables
-        'pg_stat_statements', 'spatial_ref_sys',
-    }
-    
-    # Filter out excluded tables
-    filtered_tables = [
-        (schema, table) for schema, table in all_tables 
-        if table.lower() not in EXCLUDED_TABLES
-    ]
-    
-    excluded_count = len(all_tables) - len(filtered_tables)
+    cursor.execute(f"""
+        SELECT count(*)
+        FROM information_schema.tables
+        WHERE {schema_clause} AND lower(table_name) = ANY(%s)
+    """, schema_params + [excluded_tables])
+    excluded_count = cursor.fetchone()[0]
     if excluded_count > 0:
         system.print_info(args, f"ℹ️  Skipped {excluded_count} system/framework tables")
     
-    # Use filtered tables for subsequent operations
-    all_tables = filtered_tables
-    
     # Filter by whitelisted tables if specified
     if whitelisted_tables:
         tables_to_scan = [(schema, table) for schema, table in all_tables if table in whitelisted_tables]
     else:
         tables_to_scan = all_tables
 
+    # Planner row estimates for every table in one round-trip instead of a COUNT(*) per table
+    cursor.execute(f"""
+        SELECT n.nspname, c.relname, c.reltuples::bigint
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        WHERE c.relkind IN ('r', 'p', 'm') AND {schema_clause.replace('table_schema', 'n.nspname')}
+    """, schema_params)
+    row_estimates = {(row[0], row[1]): max(row[2], 0) for row in cursor.fetchall()}
+    
+    # Only text-typed and wide numeric columns are fetched and scanned
+    scan_columns_by_table = _get_scan_columns(args, cursor, schema_clause, schema_params)
+
     results = []
     total_rows_scanned = 0
     
     for schema, table in tables_to_scan:
         qualified_table = f'"{schema}"."{table}"'
         
-        # Check row count for this table
-        cursor.execute(f"SELECT COUNT(*) FROM {qualified_table}")
-        table_row_count = cursor.fetchone()[0]
+        scan_columns = scan_columns_by_table.get((schema, table))
+        if not scan_columns:
+            system.print_debug(args, f"Skipping {qualified_table}: no scannable columns")
+            continue
+        # '%' doubled because the query always goes through psycopg2 parameter formatting
+        quoted_columns = ['"{}"'.format(column.replace('"', '""').replace('%', '%%')) for column in scan_columns]
+        
+        # reltuples is 0/-1 until the table is analyzed; count exactly only if asked to
+        table_row_count = row_estimates.get((schema, table), 0)
+        if table_row_count == 0 and exact_row_counts:
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM {qualified_table}")
+            except psycopg2.errors.QueryCanceled as e:
+                conn.rollback()
+                system.print_error(args, f"Skipping {qualified_table}: row count exceeded statement_timeout ({e})")
+                continue
+            table_row_count = cursor.fetchone()[0]
         
         # Warn if table is large and no limit set
         if table_row_count > 10000 and limit_end is None:
             system.print_info(args, f"⚠️  Scanning large table {qualified_table} ({table_row_count:,} rows) - this may take time")
         
+        query_params = {}
+        
+        # Discovery scans of very large tables can read a random sample of pages instead
+        table_source = qualified_table
+        sample_info = {}
+        if sample_percent and table_row_count > sample_threshold_rows:
+            table_source = f"{qualified_table} TABLESAMPLE SYSTEM (%(sample_percent)s)"
+            query_params['sample_percent'] = float(sample_percent)
+            sample_info = {'sampled': True, 'sample_percent': sample_percent}
+        
+        # Push the pattern filter down so only candidate rows leave the server
+        where_clause = ""
+        if pushdown_regex:
+            where_clause = " WHERE " + " OR ".join(f"{column}::text ~* %(pattern)s" for column in quoted_columns)
+            query_params['pattern'] = pushdown_regex
+        
         # Build query with optional limit
+        select_list = ", ".join(quoted_columns)
         if limit_end is not None:
-            query = f"SELECT * FROM {qualified_table} LIMIT {limit_end} OFFSET {limit_start}"
+            query = f"SELECT {select_list} FROM {table_source}{where_clause} LIMIT {limit_end} OFFSET {limit_start}"
             system.print_info(args, f"Scanning {qualified_table} (LIMIT {limit_end}, OFFSET {limit_start})")
+        elif sample_info:
+            query = f"SELECT {select_list} FROM {table_source}{where_clause}"
+            system.print_info(args, f"Scanning {qualified_table} ({sample_percent}% sample of ~{table_row_count:,} rows)")
         else:
-            query = f"SELECT * FROM {qualified_table}"
-            system.print_info(args, f"Scanning {qualified_table} (all {table_row_count:,} rows)")
+            query = f"SELECT {select_list} FROM {table_source}{where_clause}"
+            system.print_info(args, f"Scanning {qualified_table} (all ~{table_row_count:,} rows)")
         
-        cursor.execute(query)
-        columns = [column[0] for column in cursor.description]
-
+        # Named (server-side) cursor streams rows in itersize batches instead of fetchall()
         row_count = 0
-        for row in cursor.fetchall():
-            row_count += 1
-            for column, value in zip(columns, row):
-                if value:
-                    value_str = str(value)
-                    matches = system.match_strings(args, value_str)
-                    if matches:
-                        validated_matches = validate_findings(matches, args)
-                        if validated_matches:
-                            for match in validated_matches:
-                                results.append({
-                                    'host': conn.dsn,
-                                    'database': database_name,
-                                    'schema': schema,  # NEW: Track schema
-                                    'table': table,
-                                    'column': column,
-                                    'pattern_name': match['pattern_name'],
-                                    'matches': match['matches'],
-                                    'sample_text': match['sample_text'],
-                                    'profile': profile_name,
-                                    'data_source': 'postgresql'
-                                })
+        columns = None
+        try:
+            # Closed on every exit; in an aborted transaction close() skips the server CLOSE
+            with conn.cursor(name=f"hawk_scan_{schema}_{table}") as scan_cursor:
+                scan_cursor.itersize = 10000
+                psycopg2.extensions.register_type(JSON_AS_TEXT, scan_cursor)
+                scan_cursor.execute(query, query_params)
+                for row in scan_cursor:
+                    if columns is None:
+                        # Only populated after the first FETCH on a named cursor
+                        columns = [column[0] for column in scan_cursor.description]
+                    row_count += 1
+                    for column, value in zip(columns, row):
+                        if value:
+                            # Text and json values arrive as str; only bigint/numeric need converting
+                            if not isinstance(value, str):
+                                value = str(value)
+                            matches = system.match_strings(args, value)
+                            if matches:
+                                validated_matches = validate_findings(matches, args)
+                                if validated_matches:
+                                    for match in validated_matches:
+                                        results.append({
+                                            'host': conn.dsn,
+                                            'database': database_name,
+                                            'schema': schema,  # NEW: Track schema
+                                            'table': table,
+                                            'column': column,
+                                            'pattern_name': match['pattern_name'],
+                                            'matches': match['matches'],
+                                            'sample_text': match['sample_text'],
+                                            'profile': profile_name,
+                                            'data_source': 'postgresql',
+                                            **sample_info
+                                        })
+        except psycopg2.errors.QueryCanceled as e:
+            # Rolling back also discards the server-side cursor
+            conn.rollback()
+            system.print_error(args, f"Stopped scanning {qualified_table} after {row_count:,} rows: exceeded statement_timeout ({e})")
         
         total_rows_scanned += row_count
 
@@ -148,6 +349,11 @@ def execute(args):
                 limit_end = config.get('limit_end', None)  # NEW: Default to None (unlimited)
                 tables = config.get('tables', [])
                 schemas = config.get('schemas', None)  # NEW: Optional schema list
+                statement_timeout = config.get('statement_timeout', None)  # milliseconds
+                exact_row_counts = config.get('exact_row_counts', False)
+                sample_percent = config.get('sample_percent', None)
+                sample_threshold_rows = config.get('sample_threshold_rows', 1_000_000)
+                pushdown_filter = config.get('pushdown_filter', False)
 
                 if host and user and password and database:
                     system.print_info(args, f"Checking PostgreSQL Profile {key}, database {database}")
@@ -163,7 +369,12 @@ def execute(args):
                             limit_start=limit_start, 
                             limit_end=limit_end, 
                             whitelisted_tables=tables,
-                            schemas=schemas  # NEW: Pass schemas
+                            schemas=schemas,  # NEW: Pass schemas
+                            statement_timeout=statement_timeout,
+                            exact_row_counts=exact_row_counts,
+                            sample_percent=sample_percent,
+                            sample_threshold_rows=sample_threshold_rows,
+                            pushdown_filter=pushdown_filter
                         )
                         conn.close()
                 else:
@@ -10,11 +10,31 @@ import requests
 import time
 import json
 import hashlib
+import threading
+import gzip
 from datetime import datetime
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import List, Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # Try to import SDK schema, but handle case where SDK might not be in path
 try:
     from sdk.schema import VerifiedFinding, SourceInfo
@@ -32,11 +52,68 @@ except ImportError:
             return self.__dict__
 
 
-def create_retry_session(retries=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)):
+# Map scanner pattern names to backend's LOCKED 11 India PII types
+# Backend only accepts these exact PII type names
+PII_TYPE_MAP = {
+    # Aadhaar variations
+    "Aadhar": "IN_AADHAAR",
+    "Aadhaar": "IN_AADHAAR",
+    "AADHAAR": "IN_AADHAAR",
+    
+    # PAN variations  
+    "PAN": "IN_PAN",
+    "Pan": "IN_PAN",
+    
+    # Passport
+    "Passport": "IN_PASSPORT",
+    "PASSPORT": "IN_PASSPORT",
+    
+    # Voter ID
+    "Voter ID": "IN_VOTER_ID",
+    "VOTER_ID": "IN_VOTER_ID",
+    
+    # Driving License
+    "Driving License": "IN_DRIVING_LICENSE",
+    "DRIVING_LICENSE": "IN_DRIVING_LICENSE",
+    
+    # Vehicle Registration
+    "Vehicle Registration": "IN_VEHICLE_REGISTRATION",
+    "VEHICLE_REGISTRATION": "IN_VEHICLE_REGISTRATION",
+    
+    # GST
+    "GST": "IN_GST",
+    "GSTIN": "IN_GST",
+    
+    # Bank Account
+    "Bank Account": "IN_BANK_ACCOUNT",
+    "BANK_ACCOUNT": "IN_BANK_ACCOUNT",
+    
+    # IFSC
+    "IFSC": "IN_IFSC",
+    "IFSC Code": "IN_IFSC",
+    
+    # Credit Card
+    "Credit Card": "CREDIT_CARD",
+    "CREDIT_CARD": "CREDIT_CARD",
+    
+    # Phone
+    "Phone": "IN_PHONE",
+    "Phone Number": "IN_PHONE",
+    "Indian Phone Number": "IN_PHONE",
+    
+    # Email
+    "Email": "EMAIL_ADDRESS",
+    "Email Address": "EMAIL_ADDRESS"
+}
+
+
+def create_retry_session(retries=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                         pool_connections=32, pool_maxsize=64):
     """
     Create a requests session with automated retry logic
     """
     session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
     
     retry = Retry(
         total=retries,
@@ -47,13 +124,57 @@ def create_retry_session(retries=3, backoff_factor=0.5, status_forcelist=(500, 5
         allowed_methods=["POST"]  # Only retry POST requests
     )
     
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
     return session
 
 
+# Shared sessions (one per retry setting) keep pooled TCP/TLS connections across ingestions
+_SESSIONS = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(retries):
+    with _SESSION_LOCK:
+        session = _SESSIONS.get(retries)
+        if session is None:
+            session = _SESSIONS[retries] = create_retry_session(retries=retries)
+        return session
+
+
+def encode_payload(payload, compress=False):
+    """
+    Serialize an ingestion payload to a JSON request body.
+    
+    Returns:
+        (body bytes, extra headers)
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(payload).encode('utf-8')
+    if not compress:
+        return body, {}
+    # Level 3 keeps CPU low while still shrinking repetitive finding JSON several-fold
+    return gzip.compress(body, compresslevel=3), {"Content-Encoding": "gzip"}
+
+
+def get_value_hasher(name='sha256'):
+    """
+    Return a bytes -> hex digest function for value_hash.
+    
+    SHA-256 is the schema default and what the SDK emits. blake3 and xxh3 are
+    opt-in speedups; an unavailable choice falls back to SHA-256.
+    """
+    if name == 'blake3' and BLAKE3_AVAILABLE:
+        return lambda data: blake3.blake3(data).hexdigest()
+    if name == 'xxh3' and XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest
+    return lambda data: hashlib.sha256(data).hexdigest()
+
+
 def ingest_verified_findings(args, verified_findings, scan_metadata=None):
     """
     POST verified findings to backend /ingest-verified API.
@@ -100,15 +221,16 @@ def ingest_verified_findings(args, verified_findings, scan_metadata=None):
     retries = args.ingest_retry if hasattr(args, 'ingest_retry') else 3
     timeout = args.ingest_timeout if hasattr(args, 'ingest_timeout') else 30
     
-    session = create_retry_session(retries=retries)
+    session = _get_session(retries)
     
     try:
         system.print_info(args, f"⏳ Sending {len(findings_dicts)} VERIFIED findings to backend...")
         
+        body, headers = encode_payload(payload, compress=getattr(args, 'ingest_gzip', False))
         response = session.post(
             ingest_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
+            data=body,
+            headers=headers,
             timeout=timeout
         )
         
@@ -128,8 +250,6 @@ def ingest_verified_findings(args, verified_findings, scan_metadata=None):
     except Exception as e:
         system.print_error(args, f"❌ Unexpected error during ingestion: {e}")
         return False
-    finally:
-        session.close()
 
 
 def ingest_scan_results(args, grouped_results, scan_metadata=None):
@@ -141,6 +261,10 @@ def ingest_scan_results(args, grouped_results, scan_metadata=None):
     system.print_info(args, "🔄 Converting legacy scan results to Verified Findings format...")
 
     verified_findings = []
+    # All findings in one ingestion share a detection timestamp
+    detected_at = datetime.utcnow().isoformat() + "Z"
+    value_hashes = {}
+    hash_value = get_value_hasher(getattr(args, 'ingest_hash', 'sha256'))
     
     for group, findings in grouped_results.items():
         for result in findings:
@@ -158,91 +282,58 @@ def ingest_scan_results(args, grouped_results, scan_metadata=None):
             
             pattern_name = result.get('pattern_name', 'Unknown')
             
-            # Map scanner pattern names to backend's LOCKED 11 India PII types
-            # Backend only accepts these exact PII type names
-            pii_type_map = {
-                # Aadhaar variations
-                "Aadhar": "IN_AADHAAR",
-                "Aadhaar": "IN_AADHAAR",
-                "AADHAAR": "IN_AADHAAR",
-                
-                # PAN variations  
-                "PAN": "IN_PAN",
-                "Pan": "IN_PAN",
-                
-                # Passport
-                "Passport": "IN_PASSPORT",
-                "PASSPORT": "IN_PASSPORT",
-                
-                # Voter ID
-                "Voter ID": "IN_VOTER_ID",
-                "VOTER_ID": "IN_VOTER_ID",
-                
-                # Driving License
-                "Driving License": "IN_DRIVING_LICENSE",
-                "DRIVING_LICENSE": "IN_DRIVING_LICENSE",
-                
-                # Vehicle Registration
-                "Vehicle Registration": "IN_VEHICLE_REGISTRATION",
-                "VEHICLE_REGISTRATION": "IN_VEHICLE_REGISTRATION",
-                
-                # GST
-                "GST": "IN_GST",
-                "GSTIN": "IN_GST",
-                
-                # Bank Account
-                "Bank Account": "IN_BANK_ACCOUNT",
-                "BANK_ACCOUNT": "IN_BANK_ACCOUNT",
-                
-                # IFSC
-                "IFSC": "IN_IFSC",
-                "IFSC Code": "IN_IFSC",
-                
-                # Credit Card
-                "Credit Card": "CREDIT_CARD",
-                "CREDIT_CARD": "CREDIT_CARD",
-                
-                # Phone
-                "Phone": "IN_PHONE",
-                "Phone Number": "IN_PHONE",
-                "Indian Phone Number": "IN_PHONE",
-                
-                # Email
-                "Email": "EMAIL_ADDRESS",
-                "Email Address": "EMAIL_ADDRESS"
-            }
-            
             # Try to map pattern name to PII Type
             # If not in map, skip this finding (backend will reject it anyway)
-            pii_type = pii_type_map.get(pattern_name)
+            pii_type = PII_TYPE_MAP.get(pattern_name)
             if not pii_type:
                 # Skip findings that aren't in the locked 11 India PII types
                 continue
             
+            # Fields shared by every match of this result; value_hash is filled per match
+            template = {
+                "pii_type": pii_type,
+                "value_hash": None,
+                "source": source_info,
+                "validators_passed": ["regex"], # Assume regex passed
+                "validation_method": "regex",
+                "ml_confidence": 0.8,
+                "ml_entity_type": pii_type,
+                "context_excerpt": result.get('sample_text', '')[:100] if result.get('sample_text') else "",
+                "context_keywords": [],
+                "pattern_name": pattern_name,
+                "detected_at": detected_at,
+                "scanner_version": "hawk-scanner-cli-legacy-adapter"
+            }
+            
             for match_value in result.get('matches', []):
-                # Hash match
-                match_hash = hashlib.sha256(str(match_value).encode()).hexdigest()
+                # Hash match (the same value often recurs across results)
+                match_text = str(match_value)
+                match_hash = value_hashes.get(match_text)
+                if match_hash is None:
+                    match_hash = value_hashes[match_text] = hash_value(match_text.encode())
                 
                 # Create finding dict (manual since we might not have SDK loaded)
-                vf = {
-                    "pii_type": pii_type,
-                    "value_hash": match_hash,
-                    "source": source_info,
-                    "validators_passed": ["regex"], # Assume regex passed
-                    "validation_method": "regex",
-                    "ml_confidence": 0.8,
-                    "ml_entity_type": pii_type,
-                    "context_excerpt": result.get('sample_text', '')[:100] if result.get('sample_text') else "",
-                    "context_keywords": [],
-                    "pattern_name": pattern_name,
-                    "detected_at": datetime.utcnow().isoformat() + "Z",
-                    "scanner_version": "hawk-scanner-cli-legacy-adapter"
-                }
+                vf = template.copy()
+                vf["value_hash"] = match_hash
                 verified_findings.append(vf)
 
     return ingest_verified_findings(args, verified_findings, scan_metadata)
 
 
+def start_background_ingestion(args, grouped_results, scan_metadata=None):
+    """
+    Run ingest_scan_results on a worker thread so the POST overlaps with
+    result reporting (tables, Slack, Jira). Join the returned thread before exit.
+    """
+    thread = threading.Thread(
+        target=ingest_scan_results,
+        args=(args, grouped_results, scan_metadata),
+        name="hawk-ingest",
+    )
+    thread.start()
+    return thread
+
+
 def validate_ingest_url(url):
     """
     Validate that the ingestion URL is properly formatted
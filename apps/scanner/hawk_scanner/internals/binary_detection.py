@@ -1,16 +1,37 @@
 """
 Binary file detection utilities for Hawk Scanner
-Prevents scanning binary files that contain null bytes
+Prevents scanning binary files that contain null bytes or mostly control bytes
 """
 
+import functools
 import mimetypes
 import os
+import threading
+
+# Share of control bytes (other than tab/LF/CR) above which a chunk is treated as binary
+CONTROL_BYTE_RATIO = 0.30
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in (9, 10, 13))
+
+# Known binary extensions, rejected before any stat/open. mimetypes misses
+# some of these (.gz, .bz2, .xz, .dylib) or maps them by platform (.a -> text/vnd.a)
+BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.tar', '.gz', '.bz2',
+    '.xz', '.7z', '.exe', '.dll', '.so', '.dylib', '.o', '.a', '.class',
+    '.jar', '.pyc', '.pyo', '.wasm', '.mp3', '.mp4', '.avi', '.mkv', '.mov',
+    '.woff', '.woff2', '.ttf', '.otf', '.ico', '.webp'
+})
 
 
 def is_text_file(filepath, chunk_size=8192):
     """
     Detect if a file is text-based (safe to scan) or binary
     
+    Known binary extensions are rejected without touching the file. Other
+    results are cached per (path, size, mtime) for the life of the process:
+    repeat scans in a long-lived process (the scan API's thread executor)
+    skip the sniff read of unchanged files, but fs process-pool workers
+    start with an empty cache on every run.
+    
     Args:
         filepath: Path to file to check
         chunk_size: Number of bytes to read for detection (default 8KB)
@@ -18,6 +39,18 @@ def is_text_file(filepath, chunk_size=8192):
     Returns:
         bool: True if file is text, False if binary
     """
+    if os.path.splitext(filepath)[1].lower() in BINARY_EXTENSIONS:
+        return False
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return False
+    return _sniff_text_file(filepath, st.st_size, st.st_mtime_ns, chunk_size)
+
+
+@functools.lru_cache(maxsize=65536)
+def _sniff_text_file(filepath, size, mtime_ns, chunk_size):
+    # size and mtime_ns are only part of the cache key
     # Check MIME type first (fast check)
     mime_type, _ = mimetypes.guess_type(filepath)
     if mime_type:
@@ -36,28 +69,46 @@ def is_text_file(filepath, chunk_size=8192):
     
     # Read first chunk to check for null bytes
     try:
-        with open(filepath, 'rb') as f:
-            chunk = f.read(chunk_size)
-            
-            # Check for null bytes (binary indicator)
-            if b'\x00' in chunk:
-                return False
-            
-            # Check if content is mostly printable ASCII/UTF-8
-            try:
-                chunk.decode('utf-8')
-                return True
-            except UnicodeDecodeError:
-                # Try latin-1 as fallback
-                try:
-                    chunk.decode('latin-1')
-                    return True
-                except:
-                    return False
-                    
+        buffer, length = _read_head(filepath, chunk_size)
     except (IOError, OSError):
         # If we can't read the file, assume it's not scannable
         return False
+    
+    # Check for null bytes (binary indicator)
+    if buffer.find(b'\x00', 0, length) != -1:
+        return False
+    
+    if not length:
+        return True
+    
+    # Count control bytes in one C pass (no decode attempts, no exceptions)
+    chunk = buffer if length == len(buffer) else buffer[:length]
+    control_count = length - len(chunk.translate(None, _CONTROL_BYTES))
+    return control_count / length < CONTROL_BYTE_RATIO
+
+
+# Per-thread sniff buffer, reused across files instead of allocating a bytes per read
+_thread_local = threading.local()
+
+
+def _read_head(filepath, chunk_size):
+    """
+    Read up to chunk_size leading bytes into this thread's reusable buffer.
+    
+    Returns:
+        tuple: (buffer, number of bytes read); only buffer[:length] is valid
+    """
+    buffer = getattr(_thread_local, 'buffer', None)
+    if buffer is None or len(buffer) != chunk_size:
+        buffer = _thread_local.buffer = bytearray(chunk_size)
+    if not hasattr(os, 'preadv'):
+        with open(filepath, 'rb', buffering=0) as f:
+            return buffer, f.readinto(buffer)
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        return buffer, os.preadv(fd, [buffer], 0)
+    finally:
+        os.close(fd)
 
 
 def get_binary_file_stats(files):
@@ -1,4 +1,5 @@
 import re
+import functools
 
 # Regex patterns for variable assignment
 # Matches: key = "value", key: "value", key := "value"
@@ -11,8 +12,14 @@ SENSITIVE_KEYWORDS = {
     'private', 'credential'
 }
 
+# One alternation instead of a substring test per keyword (longest first)
+_SENSITIVE_KEYWORD_PATTERN = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(SENSITIVE_KEYWORDS, key=len, reverse=True)
+))
+
 # Comment indicators
 COMMENT_MARKERS = ['#', '//', '*', '--', '<!--']
+_COMMENT_MARKERS = tuple(COMMENT_MARKERS)
 
 def analyze_line_context(line):
     """
@@ -26,6 +33,11 @@ def analyze_line_context(line):
             'has_sensitive_keyword': bool
         }
     """
+    # Copy so callers can't mutate the cached result
+    return dict(_analyze_line_context(line))
+
+@functools.lru_cache(maxsize=8192)
+def _analyze_line_context(line):
     context = {
         'is_assignment': False,
         'variable_name': None,
@@ -33,15 +45,9 @@ def analyze_line_context(line):
         'has_sensitive_keyword': False
     }
     
-    stripped = line.strip()
-    
     # Check for comments
-    for marker in COMMENT_MARKERS:
-        if stripped.startswith(marker):
-            context['is_comment'] = True
-            break
-            
-    if context['is_comment']:
+    if line.lstrip().startswith(_COMMENT_MARKERS):
+        context['is_comment'] = True
         return context
         
     # Check for assignment
@@ -51,9 +57,7 @@ def analyze_line_context(line):
         context['variable_name'] = match.group(1).lower()
         
         # Check for sensitive keywords in variable name
-        for keyword in SENSITIVE_KEYWORDS:
-            if keyword in context['variable_name']:
-                context['has_sensitive_keyword'] = True
-                break
+        if _SENSITIVE_KEYWORD_PATTERN.search(context['variable_name']):
+            context['has_sensitive_keyword'] = True
                 
     return context
@@ -1,13 +1,64 @@
 import math
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this length the dict loop beats numpy's per-call overhead
+_NUMPY_MIN_LENGTH = 64
+
+if NUMBA_AVAILABLE:
+    # str.encode() buffers come through np.frombuffer as read-only arrays
+    _BYTES = types.Array(types.uint8, 1, 'C', readonly=True)
+
+    # Explicit signatures compile eagerly at import, so the first call pays no JIT cost
+    @njit(types.float64(_BYTES), cache=True, boundscheck=False)
+    def _entropy_kernel(buf):
+        """Returns the Shannon entropy of a byte buffer via a 256-bin histogram."""
+        counts = np.zeros(256, dtype=np.uint32)
+        for b in buf:
+            counts[b] += 1
+        length = buf.size
+        entropy = 0.0
+        for count in counts:
+            if count:
+                probability = count / length
+                entropy -= probability * math.log2(probability)
+        return entropy
+
+    @njit(types.float64[:](_BYTES, types.int64[:]), cache=True, boundscheck=False)
+    def _entropies_kernel(buf, offsets):
+        """Returns the entropy of each buf[offsets[i]:offsets[i + 1]] slice."""
+        entropies = np.empty(offsets.size - 1, dtype=np.float64)
+        counts = np.zeros(256, dtype=np.uint32)
+        for i in range(offsets.size - 1):
+            start = offsets[i]
+            end = offsets[i + 1]
+            for j in range(start, end):
+                counts[buf[j]] += 1
+            length = end - start
+            entropy = 0.0
+            for j in range(start, end):
+                count = counts[buf[j]]
+                if count:
+                    probability = count / length
+                    entropy -= probability * math.log2(probability)
+                    counts[buf[j]] = 0
+            entropies[i] = entropy
+        return entropies
 
 def calculate_shannon_entropy(data):
     """
-    Calculates the Shannon Entropy of a string.
+    Calculates the Shannon Entropy of a string or byte sequence.
     
     Formula: H(X) = - sum(p(x) * log2(p(x)))
     
     Args:
-        data: Input string
+        data: Input string (entropy over characters) or bytes-like object
+              (entropy over byte values, no decoding)
         
     Returns:
         float: Entropy value
@@ -15,13 +66,33 @@ def calculate_shannon_entropy(data):
     if not data:
         return 0
 
+    if isinstance(data, str):
+        if not data.isascii():
+            return _symbol_entropy(data, len(data))
+        # bytes == characters for ASCII
+        data = data.encode('ascii')
+    
+    buf = np.frombuffer(data, dtype=np.uint8)
+    
+    # Compiled histogram loop
+    if NUMBA_AVAILABLE:
+        return _entropy_kernel(buf)
+    
+    # Long inputs: one vectorized histogram
+    if buf.size >= _NUMPY_MIN_LENGTH:
+        counts = np.bincount(buf, minlength=256)
+        probabilities = counts[counts > 0] / buf.size
+        return float(-(probabilities * np.log2(probabilities)).sum())
+
+    return _symbol_entropy(data, buf.size)
+
+def _symbol_entropy(symbols, length):
     entropy = 0
-    length = len(data)
     
-    # Count occurrences of each character
+    # Count occurrences of each character (or byte value)
     counts = {}
-    for char in data:
-        counts[char] = counts.get(char, 0) + 1
+    for symbol in symbols:
+        counts[symbol] = counts.get(symbol, 0) + 1
     
     # Calculate entropy
     for count in counts.values():
@@ -30,12 +101,61 @@ def calculate_shannon_entropy(data):
         
     return entropy
 
+def calculate_shannon_entropies(values):
+    """
+    Calculates the Shannon Entropy of many strings (or bytes-like values) in one vectorized pass.
+    
+    Equivalent to [calculate_shannon_entropy(v) for v in values], but ASCII
+    strings are joined into one buffer. With Numba each slice is scored by a
+    compiled loop; otherwise (string, byte) pairs are counted with np.unique
+    and the per-string sums are folded with np.bincount.
+    
+    Args:
+        values: List of input strings or bytes-like objects
+        
+    Returns:
+        list: Entropy value per value
+    """
+    entropies = [0] * len(values)
+    byte_indices = []
+    encoded = []
+    for idx, value in enumerate(values):
+        if not value:
+            continue
+        if not isinstance(value, str):
+            byte_indices.append(idx)
+            encoded.append(value)
+        elif value.isascii():
+            byte_indices.append(idx)
+            encoded.append(value.encode('ascii'))
+        else:
+            entropies[idx] = calculate_shannon_entropy(value)
+    
+    if encoded and NUMBA_AVAILABLE:
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        for idx, total in zip(byte_indices, _entropies_kernel(data, offsets).tolist()):
+            entropies[idx] = total
+    elif encoded:
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        keys = np.repeat(np.arange(len(encoded), dtype=np.int64) * 256, lengths) + data
+        pairs, counts = np.unique(keys, return_counts=True)
+        rows = pairs >> 8
+        probabilities = counts / lengths[rows]
+        sums = np.bincount(rows, weights=probabilities * np.log2(probabilities), minlength=len(encoded))
+        for idx, total in zip(byte_indices, (0.0 - sums).tolist()):
+            entropies[idx] = total
+    
+    return entropies
+
 def is_high_entropy(data, threshold=3.5):
     """
     Checks if a string has high entropy (indicative of a random secret).
     
     Args:
-        data: String to check
+        data: String or bytes to check
         threshold: Entropy threshold (default 3.5 is good for API keys)
         
     Returns:
@@ -1,15 +1,229 @@
 import re
+import functools
+import numpy as np
 from typing import List, Dict, Any, Optional
 from hawk_scanner.internals import entropy
 from hawk_scanner.internals import code_analyzer
 from hawk_scanner.internals import validation_integration
 
+try:
+    from re import _parser as _sre_parse, _constants as _sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse, sre_constants as _sre_constants
+
+# Placeholder values that mark a match as test data
+_TEST_DATA_REGEX = re.compile(r'example|test|12345', re.IGNORECASE)
+
+# Lookarounds and absolute anchors can see across a line break in the joined buffer
+_LINE_SENSITIVE_REGEX = re.compile(r'\(\?<?[=!]|\\[AZzG]')
+
+# Line boundaries str.splitlines() honours besides '\n'
+_OTHER_LINE_BREAKS = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+_NEWLINE = re.compile('\n')
+
+_REPEAT_OPS = tuple(getattr(_sre_constants, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                    if hasattr(_sre_constants, name))
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern_regex: str, ascii_content: bool = False) -> re.Pattern:
+    """Compile a fingerprint regex once per process (scanners are created per scan call)."""
+    # MULTILINE keeps ^/$ per line when scanning the whole buffer at once
+    return re.compile(pattern_regex, case_flags(pattern_regex, ascii_content) | re.MULTILINE)
+
+def precompile_patterns(patterns: Dict[str, str]) -> None:
+    """Fills the per-process regex and literal caches for a fingerprint catalog."""
+    for pattern_regex in patterns.values():
+        _compile_pattern(pattern_regex, True)
+        _compile_pattern(pattern_regex, False)
+        _required_literal(pattern_regex)
+
+# (lowercase, uppercase) code points of each ASCII letter
+_ASCII_CASE_PAIRS = [(ord(c), ord(c.upper())) for c in 'abcdefghijklmnopqrstuvwxyz']
+
+@functools.lru_cache(maxsize=1024)
+def _ascii_case_neutral(pattern_regex: str) -> bool:
+    """
+    Returns True if re.IGNORECASE cannot change what pattern_regex matches in
+    ASCII text.
+    
+    That holds when the pattern has no letter literals and every character
+    class contains both cases of each ASCII letter or neither (e.g.
+    [A-Za-z0-9]). Non-ASCII literals, backreferences and unknown constructs
+    count as case-sensitive.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern_regex, re.IGNORECASE)
+    except re.error:
+        return False
+    
+    def class_neutral(items):
+        members = [False] * 128
+        for op, av in items:
+            if op is _sre_constants.LITERAL:
+                if av > 127:
+                    return False
+                members[av] = True
+            elif op is _sre_constants.RANGE:
+                if av[1] > 127:
+                    return False
+                members[av[0]:av[1] + 1] = [True] * (av[1] - av[0] + 1)
+            elif op not in (_sre_constants.NEGATE, _sre_constants.CATEGORY):
+                return False
+        return all(members[lower] == members[upper] for lower, upper in _ASCII_CASE_PAIRS)
+    
+    def walk(items):
+        for op, av in items:
+            if op in (_sre_constants.LITERAL, _sre_constants.NOT_LITERAL):
+                if av > 127 or chr(av).isalpha():
+                    return False
+            elif op is _sre_constants.IN:
+                if not class_neutral(av):
+                    return False
+            elif op is _sre_constants.SUBPATTERN:
+                if not walk(av[-1]):
+                    return False
+            elif op is _sre_constants.BRANCH:
+                if not all(walk(branch) for branch in av[1]):
+                    return False
+            elif op in _REPEAT_OPS:
+                if not walk(av[2]):
+                    return False
+            elif op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+                if not walk(av[1]):
+                    return False
+            elif op not in (_sre_constants.ANY, _sre_constants.AT, _sre_constants.CATEGORY):
+                return False
+        return True
+    
+    return walk(parsed)
+
+def case_flags(pattern_regex: str, ascii_content: bool = False) -> int:
+    """
+    Returns re.IGNORECASE, or 0 when scanning ASCII content with a pattern
+    it can't affect; case-folding ops defeat re's literal and charset fast paths.
+    """
+    if ascii_content and _ascii_case_neutral(pattern_regex):
+        return 0
+    return re.IGNORECASE
+
+@functools.lru_cache(maxsize=1024)
+def _required_literal(pattern_regex: str) -> Optional[str]:
+    """
+    Returns the longest lowercase ASCII literal every match of pattern_regex
+    must contain (at least 3 chars), or None.
+    
+    Only literals on the pattern's mandatory path count: top-level runs and
+    runs inside plain groups, never inside alternations or repeats.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern_regex, re.IGNORECASE)
+    except re.error:
+        return None
+    
+    best = ''
+    def walk(items):
+        nonlocal best
+        run = ''
+        for op, av in items:
+            if op is _sre_constants.LITERAL and av < 128:
+                run += chr(av).lower()
+                continue
+            best = max(best, run, key=len)
+            run = ''
+            if op is _sre_constants.SUBPATTERN:
+                walk(av[-1])
+        best = max(best, run, key=len)
+    
+    walk(parsed)
+    return best if len(best) >= 3 else None
+
+def literal_prefilter(patterns: Dict[str, str], content: str) -> Dict[str, str]:
+    """
+    Returns the patterns that can match content, in catalog order.
+    
+    The pure-Python stand-in for the Hyperscan prefilter: a pattern is dropped
+    when its mandatory literal (see _required_literal) is absent from the
+    lowercased content. Only ASCII content is filtered, where lowercasing
+    matches re.IGNORECASE exactly; otherwise all patterns are returned.
+    """
+    if not content.isascii():
+        return patterns
+    lowered = content.lower()
+    return {name: regex for name, regex in patterns.items()
+            if (literal := _required_literal(regex)) is None or literal in lowered}
+
+def _line_index(content: str):
+    """
+    Returns (buffer, end, line_starts) describing content.splitlines().
+    
+    Lines are buffer[line_starts[i]:line_starts[i + 1] - 1] (the last one ends
+    at end), separated by a single '\n'. Content that only breaks on '\n' is
+    used in place, so no per-line strings or joined copy are built; line
+    starts are found with numpy over the ASCII bytes or a regex otherwise.
+    """
+    if _OTHER_LINE_BREAKS.search(content):
+        lines = content.splitlines()
+        buffer = '\n'.join(lines)
+        line_starts = np.zeros(len(lines), dtype=np.int64)
+        np.cumsum(np.fromiter((len(line) + 1 for line in lines[:-1]), dtype=np.int64, count=len(lines) - 1), out=line_starts[1:])
+        return buffer, len(buffer), line_starts
+    
+    # splitlines() drops one trailing line break
+    end = len(content) - 1 if content.endswith('\n') else len(content)
+    if content.isascii():
+        newlines = np.flatnonzero(np.frombuffer(content.encode('ascii'), dtype=np.uint8)[:end] == 10)
+    else:
+        newlines = np.fromiter((m.start() for m in _NEWLINE.finditer(content, 0, end)), dtype=np.int64)
+    line_starts = np.empty(newlines.size + 1, dtype=np.int64)
+    line_starts[0] = 0
+    line_starts[1:] = newlines + 1
+    return content, end, line_starts
+
+def _line_at(buffer, end, line_starts, line_idx):
+    """Slices a single line out of the buffer described by _line_index."""
+    line_end = int(line_starts[line_idx + 1]) - 1 if line_idx + 1 < len(line_starts) else end
+    return buffer[int(line_starts[line_idx]):line_end]
+
+def _iter_line_matches(pattern_regex, buffer, end, line_starts, start_line=0, ascii_content=False):
+    """
+    Yields (line_idx, match_text) for every per-line match of a pattern.
+    
+    Runs one finditer over buffer[:end] and maps match offsets back to lines.
+    Falls back to scanning line by line when the pattern uses
+    lookarounds/anchors or a match crosses a line break, where whole-buffer
+    results could differ from per-line ones. Lines before start_line are
+    known not to match and are skipped. ascii_content says buffer is ASCII.
+    """
+    compiled_regex = _compile_pattern(pattern_regex, ascii_content)
+    if not _LINE_SENSITIVE_REGEX.search(pattern_regex):
+        starts = []
+        texts = []
+        for match_obj in compiled_regex.finditer(buffer, int(line_starts[start_line]), end):
+            match_text = match_obj.group(0)
+            if '\n' in match_text:
+                break
+            starts.append(match_obj.start())
+            texts.append(match_text)
+        else:
+            line_indices = np.searchsorted(line_starts, starts, side='right') - 1
+            yield from zip(line_indices.tolist(), texts)
+            return
+    
+    for line_idx in range(start_line, len(line_starts)):
+        line = _line_at(buffer, end, line_starts, line_idx)
+        # Use finditer to get full match objects (avoids capturing group issues)
+        for match_obj in compiled_regex.finditer(line):
+            yield line_idx, match_obj.group(0)
+
 class ContextAwareScanner:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, pattern_db=None):
         self.debug = debug
+        # Optional Hyperscan PatternDatabase used to skip patterns (and leading lines) that can't match
+        self.pattern_db = pattern_db
         self.min_entropy_threshold = 3.0 # Slightly lower than 3.5 to be safe
     
-    def scan(self, content: str, patterns: Dict[str, str], source: str = 'text') -> List[Dict[str, Any]]:
+    def scan(self, content: str, patterns: Dict[str, str], source: str = 'text', first_offsets: Dict[str, int] = None) -> List[Dict[str, Any]]:
         """
         Scans content using context-aware logic.
         
@@ -17,70 +231,106 @@ class ContextAwareScanner:
             content: Text to scan
             patterns: Dictionary of {pattern_name: regex}
             source: Source identifier
+            first_offsets: Hyperscan first-match offsets already taken over content,
+                used instead of scanning it with pattern_db again
             
         Returns:
             List of findings with confidence scores
         """
         findings = []
-        lines = content.splitlines()
+        if not content:
+            return findings
+        # Lines separated by a single '\n' in buffer[:end], plus each line's start offset
+        buffer, end, line_starts = _line_index(content)
+        is_ascii = buffer.isascii()
+        # (line, code context) per matched line, shared across patterns
+        contexts = {}
+        
+        # One Hyperscan pass finds which patterns can match and where each one first can
+        start_lines = {}
+        precomputed = first_offsets is not None
+        if not precomputed and self.pattern_db is not None:
+            first_offsets = self.pattern_db.first_match_offsets(buffer)
+        if first_offsets is not None:
+            patterns = {name: regex for name, regex in patterns.items() if name in first_offsets}
+            # Byte offsets only equal str offsets for ASCII content; precomputed ones are
+            # into content, which _line_index only rewrites for breaks other than '\n'
+            if is_ascii and (buffer is content or not precomputed):
+                names = list(patterns)
+                last_bytes = [max(first_offsets[name] - 1, 0) for name in names]
+                line_indices = np.searchsorted(line_starts, last_bytes, side='right') - 1
+                start_lines = dict(zip(names, line_indices.tolist()))
+        
+        # Without Hyperscan, skip patterns whose mandatory literal is absent (IGNORECASE
+        # regexes get no literal-prefix search from re); lowercasing is exact for ASCII
+        lowered = buffer.lower() if first_offsets is None and is_ascii else None
+        # Catalogs repeat regexes under different names; scan each distinct one once
+        hits_by_regex = {}
         
         for pattern_name, pattern_regex in patterns.items():
-            compiled_regex = re.compile(pattern_regex, re.IGNORECASE)
-            
-            # Iterate line by line for context
-            for line_idx, line in enumerate(lines):
-                # Use finditer to get full match objects (avoids capturing group issues)
-                matches_iter = compiled_regex.finditer(line)
+            hits = hits_by_regex.get(pattern_regex)
+            if hits is None:
+                literal = _required_literal(pattern_regex) if lowered is not None else None
+                if literal is not None and literal not in lowered:
+                    hits = []
+                else:
+                    start_line = start_lines.get(pattern_name, 0)
+                    hits = list(_iter_line_matches(pattern_regex, buffer, end, line_starts, start_line, is_ascii))
+                hits_by_regex[pattern_regex] = hits
+            if not hits:
+                continue
+            # Entropy and SDK validation of every match for this pattern in one pass each
+            match_texts = [match_text for _, match_text in hits]
+            entropies = entropy.calculate_shannon_entropies(match_texts)
+            validations = validation_integration.validate_matches(match_texts, pattern_name)
+            for (line_idx, match_text), ent, (is_valid_format, method) in zip(hits, entropies, validations):
+                cached = contexts.get(line_idx)
+                if cached is None:
+                    line = _line_at(buffer, end, line_starts, line_idx)
+                    cached = contexts[line_idx] = (line, code_analyzer.analyze_line_context(line))
+                line, context = cached
                 
-                # Analyze Code Context once per line
-                context = code_analyzer.analyze_line_context(line)
+                # Calculate Confidence Score
+                score, reasons = self._calculate_confidence(match_text, pattern_name, context, ent)
                 
-                for match_obj in matches_iter:
-                    # Get the full match string
-                    match_text = match_obj.group(0)
-                    
-                    # Calculate Confidence Score
-                    score, reasons = self._calculate_confidence(match_text, pattern_name, context)
-                    
-                    # Validate using SDK (Strict Validation Phase 1 logic)
-                    is_valid_format, method = validation_integration.validate_match(match_text, pattern_name)
-                    
-                    if is_valid_format:
-                        # If SDK says it's valid (checksum ok), boost score significantly
-                        score = 100
-                        reasons.append(f"SDK Validation Passed ({method})")
-                    elif method == 'no_validator':
-                        # No validator exists, rely on heuristic score
-                        pass
-                    elif method == 'scope_rejected':
-                           # See previous notes
-                           pass
-                    else:
-                        # Validator existed but failed (checksum fail)
-                        score = 0
-                        reasons.append("SDK Validation Failed")
-
-                    # Final Decision
-                    if score >= 50:
-                        findings.append({
-                            'data_source': source,
-                            'pattern_name': pattern_name,
-                            'matches': [match_text],
-                            'sample_text': line[:100], # Line context
-                            'line_number': line_idx + 1,
-                            'confidence_score': score,
-                            'confidence_reasons': reasons,
-                            'validation_method': method
-                        })
-                            
+                # Validated using SDK above (Strict Validation Phase 1 logic)
+                if is_valid_format:
+                    # If SDK says it's valid (checksum ok), boost score significantly
+                    score = 100
+                    reasons.append(f"SDK Validation Passed ({method})")
+                elif method == 'no_validator':
+                    # No validator exists, rely on heuristic score
+                    pass
+                elif method == 'scope_rejected':
+                       # See previous notes
+                       pass
+                else:
+                    # Validator existed but failed (checksum fail)
+                    score = 0
+                    reasons.append("SDK Validation Failed")
+
+                # Final Decision
+                if score >= 50:
+                    findings.append({
+                        'data_source': source,
+                        'pattern_name': pattern_name,
+                        'matches': [match_text],
+                        'sample_text': line[:100], # Line context
+                        'line_number': line_idx + 1,
+                        'confidence_score': score,
+                        'confidence_reasons': reasons,
+                        'validation_method': method
+                    })
+                        
         return self._deduplicate_findings(findings)
 
-    def _calculate_confidence(self, match: str, pattern_name: str, context: Dict) -> tuple[int, List[str]]:
+    def _calculate_confidence(self, match: str, pattern_name: str, context: Dict, ent: float = None) -> tuple[int, List[str]]:
         score = 50 # Base score
         reasons = []
         
         # 1. Entropy Check
-        ent = entropy.calculate_shannon_entropy(match)
+        if ent is None:
+            ent = entropy.calculate_shannon_entropy(match)
         if ent > self.min_entropy_threshold:
             score += 20
             reasons.append(f"High Entropy ({ent:.2f})")
@@ -105,13 +355,20 @@ class ContextAwareScanner:
             reasons.append("In Comment")
             
         # 3. Test Data Check
-        if "example" in match.lower() or "test" in match.lower() or "12345" in match:
+        if _TEST_DATA_REGEX.search(match):
             score = 0
             reasons.append("Test Data Value")
             
         return max(0, min(100, score)), reasons
 
     def _deduplicate_findings(self, findings):
-        # ... Simple deduplication logic ...
-        # For now return as is or minimal dedup
-        return findings
+        # Same value on the same line for the same pattern is one finding; hash keys keep this linear
+        seen = set()
+        unique = []
+        for finding in findings:
+            key = (finding['pattern_name'], finding['matches'][0], finding['line_number'])
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(finding)
+        return unique
@@ -1,6 +1,7 @@
 import jmespath
 from rich.console import Console 
 from rich.table import Table
+from rich.errors import MarkupError
 import json, requests, argparse, yaml, re, datetime, os, subprocess, platform, hashlib
 from tinydb import TinyDB, Query
 import numpy as np
@@ -13,10 +14,21 @@ import PyPDF2
 import patoolib
 import tempfile
 import shutil
+import mmap
+import functools
+import threading
 import os, cv2
 import tarfile
 import pkg_resources
 from concurrent.futures import ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 
 data_sources = ['s3', 'mysql', 'redis', 'firebase', 'gcs', 'fs', 'postgresql', 'mongodb', 'slack', 'couchdb', 'gdrive', 'gdrive_workspace', 'text']
@@ -32,17 +44,21 @@ def parse_args(args=None):
     parser.add_argument('--fingerprint', action='store', help='Override YAML fingerprint file path')
     parser.add_argument('--json', help='Save output to a json file')
     parser.add_argument('--csv', help='Save output to a csv file')
+    parser.add_argument('--json-lines', help='Write results as newline-delimited JSON ({"<source>": result} per line) to a file, or "-" for stdout, as each data source finishes')
     parser.add_argument('--stdout', action='store_true', help='Print output to stdout in JSON format')
     parser.add_argument('--quiet', action='store_true', help='Print only the results')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--no-write', action='store_true', help='Do not write previous alerts to file, this may flood you with duplicate alerts')
     parser.add_argument('--shutup', action='store_true', help='Suppress the Hawk Eye banner 🫣', default=False)
     parser.add_argument('--version', action='version', version='%(prog)s v' + version)
+    parser.add_argument('--pool', choices=['process', 'thread'], default='process', help="Worker pool for 'all' parallel scans; use 'thread' for network-bound sources (default: process)")
     parser.add_argument('--hawk-thuu', action='store_true', help="Delete all spitted files during testing phase forcefully")
     # NEW: Auto-ingestion support
     parser.add_argument('--ingest-url', type=str, help='Automatically POST scan results to backend API (e.g., http://localhost:8080/api/v1/ingest)')
     parser.add_argument('--ingest-retry', type=int, default=3, help='Number of retries for ingestion (default: 3)')
     parser.add_argument('--ingest-timeout', type=int, default=30, help='Timeout for ingestion request in seconds (default: 30)')
+    parser.add_argument('--ingest-gzip', action='store_true', help='Gzip-compress the ingestion request body (backend must accept Content-Encoding: gzip)')
+    parser.add_argument('--ingest-hash', choices=['sha256', 'blake3', 'xxh3'], default='sha256', help='Hash used for ingested value_hash (default: sha256; blake3/xxh3 are faster but only dedupe against findings hashed the same way)')
     return parser.parse_args(args)
     
 console = Console()
@@ -58,7 +74,7 @@ def print_debug(args, message):
     if args and type(args) == argparse.Namespace and args.debug and not args.quiet:
         try:
             console.print(f"[blue][DEBUG][/blue] {str(message)}")
-        except Exception as e:
+        except (MarkupError, UnicodeEncodeError):
             pass
 
 def print_error(args, message):
@@ -124,11 +140,27 @@ def RedactData(input_string):
 
     return redacted_string
 
+# Parsed connection configs keyed by (connection file, connection JSON). Bounded, since a
+# long-lived caller such as scanner_api passes a distinct connection JSON for every scan
+_connection_cache = {}
+_CONNECTION_CACHE_SIZE = 32
+
+def _cache_connection(cache_key, connections):
+    if len(_connection_cache) >= _CONNECTION_CACHE_SIZE:
+        # Dicts keep insertion order, so this drops the oldest entry
+        _connection_cache.pop(next(iter(_connection_cache)), None)
+    _connection_cache[cache_key] = connections
+
 def get_connection(args):
+    cache_key = (args.connection, args.connection_json)
+    if cache_key in _connection_cache:
+        return _connection_cache[cache_key]
+
     if args.connection:
         if os.path.exists(args.connection):
             with open(args.connection, 'r') as file:
                 connections = yaml.safe_load(file)
+                _cache_connection(cache_key, connections)
                 return connections
         else:
             print_error(args, f"Connection file not found: {args.connection}")
@@ -136,6 +168,7 @@ def get_connection(args):
     elif args.connection_json:
         try:
             connections = json.loads(args.connection_json)
+            _cache_connection(cache_key, connections)
             return connections
         except json.JSONDecodeError as e:
             print_error(args, f"Error parsing JSON: {e}")
@@ -174,7 +207,8 @@ def get_fingerprint_file(args=None):
                     # NEW: Validate patterns after loading
                     _validate_fingerprint_patterns(args, _fingerprint_cache)
                     return _fingerprint_cache
-            except Exception as e:
+            except (OSError, yaml.YAMLError, AttributeError):
+                # Unreadable or malformed local file: fall back to the published fingerprints
                 pass
 
         file_path = "https://github.com/rohitcoder/hawk-eye/raw/main/fingerprint.yml"
@@ -286,7 +320,108 @@ def normalize_for_matching(text):
     # normalized = normalized.replace('.', '')
     return normalized
 
-from hawk_scanner.internals.scanner_engine import ContextAwareScanner
+from hawk_scanner.internals.scanner_engine import ContextAwareScanner, precompile_patterns
+
+class PatternDatabase:
+    """
+    All fingerprint patterns compiled into one Hyperscan database.
+
+    Used as a single-pass prefilter: content is scanned once to find which
+    patterns can match, and only those run through the Python scanner.
+    Patterns are compiled with HS_FLAG_PREFILTER, so hits are a superset of
+    what Python's re would find; patterns Hyperscan rejects always run.
+    """
+    FLAGS = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER |
+             hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP) if HYPERSCAN_AVAILABLE else 0
+
+    def __init__(self, patterns):
+        self.names = list(patterns)
+        self.always = []
+        supported = []
+        for idx, name in enumerate(self.names):
+            try:
+                self._compile([(idx, patterns[name])])
+                supported.append((idx, patterns[name]))
+            except hyperscan.error:
+                self.always.append(idx)
+        self.database = self._compile(supported) if supported else None
+        # Hyperscan scratch space can't be shared by concurrent scans; keep one per thread
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # Ship the compiled database as bytes (loading takes well under a millisecond,
+        # compiling over a second); scratch space is rebuilt per thread on the other side
+        state = self.__dict__.copy()
+        del state['_local']
+        if self.database is not None:
+            state['database'] = hyperscan.dumpb(self.database)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.database is not None:
+            self.database = hyperscan.loadb(self.database, hyperscan.HS_MODE_BLOCK)
+        self._local = threading.local()
+
+    def _compile(self, indexed_patterns):
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[regex.encode('utf-8') for _, regex in indexed_patterns],
+            ids=[idx for idx, _ in indexed_patterns],
+            elements=len(indexed_patterns),
+            flags=[self.FLAGS] * len(indexed_patterns)
+        )
+        return database
+
+    def first_match_offsets(self, content):
+        """
+        Scan content once and return {pattern_name: end offset of its first candidate match}.
+
+        Offsets are in UTF-8 bytes. With HS_FLAG_SINGLEMATCH only each pattern's
+        first (lowest end offset) match is reported; patterns Hyperscan rejected
+        get offset 0.
+        """
+        hits = dict.fromkeys(self.always, 0)
+        if self.database is not None:
+            def on_match(pattern_id, start, end, flags, context):
+                hits.setdefault(pattern_id, end)
+            # bytes-like content (bytes, mmap) is scanned in place
+            data = content.encode('utf-8', errors='replace') if isinstance(content, str) else content
+            self.database.scan(data, match_event_handler=on_match, scratch=self._scratch())
+        return {self.names[idx]: hits[idx] for idx in sorted(hits)}
+
+    def _scratch(self):
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.database)
+        return scratch
+
+    def matching_patterns(self, patterns, content):
+        """Return the subset of patterns that can match content, in fingerprint order."""
+        return {name: patterns[name] for name in self.first_match_offsets(content) if name in patterns}
+
+def build_pattern_db(patterns):
+    """Compile fingerprint patterns into a PatternDatabase, or None if Hyperscan isn't installed."""
+    if not HYPERSCAN_AVAILABLE or not patterns:
+        return None
+    return PatternDatabase(patterns)
+
+# Global cache for the compiled pattern database (built once per process)
+_pattern_db_cache = None
+# Held while building, so a scan arriving during warmup waits instead of compiling again
+_pattern_db_lock = threading.Lock()
+
+def get_pattern_db(patterns):
+    global _pattern_db_cache
+    with _pattern_db_lock:
+        if _pattern_db_cache is None or _pattern_db_cache[0] is not patterns:
+            _pattern_db_cache = (patterns, build_pattern_db(patterns))
+        return _pattern_db_cache[1]
+
+def warmup(patterns):
+    """Compile the Hyperscan database and regexes for patterns ahead of the first scan."""
+    get_pattern_db(patterns)
+    precompile_patterns(patterns)
 
 def match_strings(args, content, source='text'):
     redacted = False
@@ -297,9 +432,12 @@ def match_strings(args, content, source='text'):
     
     patterns = get_fingerprint_file(args)
     
-    # Use New Context-Aware Scanner
-    scanner = ContextAwareScanner(debug=args.debug if args else False)
-    findings = scanner.scan(content, patterns, source)
+    return _scan_content(args, content, patterns, source, get_pattern_db(patterns))
+
+def _scan_content(args, content, patterns, source, pattern_db=None, first_offsets=None):
+    # Use New Context-Aware Scanner (prefiltered by the Hyperscan database when available)
+    scanner = ContextAwareScanner(debug=args.debug if args else False, pattern_db=pattern_db)
+    findings = scanner.scan(content, patterns, source, first_offsets)
     
     # Process findings for compatibility with legacy format
     matched_strings = []
@@ -314,6 +452,44 @@ def match_strings(args, content, source='text'):
             
     return matched_strings
 
+def _is_ascii(buffer, window=1 << 20):
+    for offset in range(0, len(buffer), window):
+        if not buffer[offset:offset + window].isascii():
+            return False
+    return True
+
+def scan_file_mmap(args, file_path, source=None):
+    """
+    Scan a plain-text file through a read-only mmap.
+
+    The Hyperscan prefilter runs over the mapped pages directly, so files with
+    no possible match are never copied into Python memory. Returns None when
+    the mmap path doesn't apply (no Hyperscan, non-ASCII content, or the file
+    can't be mapped) and the caller should read the file normally.
+    """
+    patterns = get_fingerprint_file(args)
+    pattern_db = get_pattern_db(patterns)
+    if pattern_db is None:
+        return None
+    with open(file_path, 'rb') as file:
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped (and have nothing to match)
+            return []
+        except (OSError, OverflowError):
+            return None
+        with mm:
+            # The database is compiled for UTF-8; only ASCII is safe to scan undecoded
+            if not _is_ascii(mm):
+                return None
+            # The only database pass; the scanner reuses its offsets instead of scanning again
+            first_offsets = pattern_db.first_match_offsets(mm)
+            if not first_offsets:
+                return []
+            content = mm[:].decode('ascii')
+    return _scan_content(args, content, patterns, source, first_offsets=first_offsets)
+
 def should_exclude_file(args, file_name, exclude_patterns):
     _, extension = os.path.splitext(file_name)
     if extension in exclude_patterns:
@@ -360,6 +536,9 @@ def scan_file(file_path, args=None, source=None):
         matched_strings = find_pii_in_archive(args, file_path, source)
         is_archive = True
     else:
+        matched_strings = scan_file_mmap(args, file_path, source)
+        if matched_strings is not None:
+            return matched_strings
         # For other file types, read content normally
         with open(file_path, 'rb') as file:
             # Attempt to decode using UTF-8, fallback to 'latin-1' if needed
@@ -536,25 +715,30 @@ def find_pii_in_archive(args, file_path, source):
     return content
 
 
+@functools.lru_cache(maxsize=None)
+def _owner_name(uid):
+    import pwd
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+@functools.lru_cache(maxsize=None)
+def _group_name(gid):
+    import grp
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
 def getFileData(file_path):
     try:
-        import pwd
-        import grp
-        
         # Get file metadata
         file_stat = os.stat(file_path)
 
-        # Get the username of the file's creator/owner
-        try:
-            creator_name = pwd.getpwuid(file_stat.st_uid).pw_name
-        except KeyError:
-            creator_name = str(file_stat.st_uid)
-            
-        # Get Group name
-        try:
-            group_name = grp.getgrgid(file_stat.st_gid).gr_name
-        except KeyError:
-            group_name = str(file_stat.st_gid)
+        # Get the username/group of the file's owner (cached per uid/gid)
+        creator_name = _owner_name(file_stat.st_uid)
+        group_name = _group_name(file_stat.st_gid)
 
         # Convert timestamps to human-readable format
         created_time = datetime.datetime.fromtimestamp(file_stat.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
@@ -582,6 +766,43 @@ def getFileData(file_path):
         return {"error": str(e)}
 
 
+# Shared HTTP session for Slack/Jira: keep-alive connections and one TLS context across notifications
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # pool_maxsize matches the notifier thread pool; Retry only replays idempotent requests
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+        return _http_session
+
+# TinyDB is not thread-safe and notifications (alert and Jira user caches) are sent from a thread pool
+_alerts_db_lock = threading.Lock()
+# Striped by alert hash, so identical alerts are checked, sent and recorded one at a time
+# (unrelated alerts only contend when their hashes share a stripe)
+ALERT_LOCK_STRIPES = 64
+_alert_locks = tuple(threading.Lock() for _ in range(ALERT_LOCK_STRIPES))
+
+def notify_finding(args, result, message):
+    """Creates the Jira ticket and sends the Slack alert for a finding, in that order."""
+    ## Duplicates are detected with the "Message Link" line removed, as in SlackNotify
+    msg_hash = calculate_msg_hash("\n".join(line for line in message.split("\n") if "Message Link" not in line))
+    alert_lock = _alert_locks[hash(msg_hash) % ALERT_LOCK_STRIPES]
+    # suppress_duplicates checks before sending and records after, so an identical
+    # alert must wait for this one to finish
+    with alert_lock:
+        try:
+            create_jira_ticket(args, result, message)
+        finally:
+            # A failed ticket is reported by the caller; the Slack alert still goes out
+            SlackNotify(message, args)
+
 def SlackNotify(msg, args):
     connections = get_connection(args)
     if not args.no_write:
@@ -603,7 +824,9 @@ def SlackNotify(msg, args):
             msg_hash = calculate_msg_hash(msg)
             # Check if the message hash already exists in the previous alerts database
             alert_query = Query()
-            if db.search(alert_query['msg_hash'] == msg_hash):
+            with _alerts_db_lock:
+                duplicate = db.search(alert_query['msg_hash'] == msg_hash)
+            if duplicate:
                 print_info(args, "Duplicate message detected. Skipping webhook trigger.")
                 return
         
@@ -615,28 +838,37 @@ def SlackNotify(msg, args):
                     'text': original_msg,
                 }
                 headers = {'Content-Type': 'application/json'}
-                requests.post(webhook_url, data=json.dumps(payload), headers=headers)
+                get_http_session().post(webhook_url, data=json.dumps(payload), headers=headers)
                 if suppress_duplicates and not args.no_write:
                     # Store the message hash in the previous alerts database
-                    db.insert({'msg_hash': msg_hash})
+                    with _alerts_db_lock:
+                        db.insert({'msg_hash': msg_hash})
             except Exception as e:
                 print_error(args, f"An error occurred: {str(e)}")
 
+# Severity keywords, each group folded into one alternation (longest first)
+def _keyword_pattern(keywords):
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+_GOVERNMENT_FINANCIAL_KEYWORDS = _keyword_pattern(['ssn', 'aadhaar', 'aadhar', 'pan', 'pancard', 'credit_card', 'debit_card', 'passport'])
+_CREDENTIAL_KEYWORDS = _keyword_pattern(['aws_key', 'api_key', 'secret', 'password', 'token', 'private_key', 'access_key'])
+_CONTACT_KEYWORDS = _keyword_pattern(['email', 'phone', 'mobile'])
+
 def evaluate_severity(json_data, rules):
     """Evaluate severity based on PII TYPE, not volume (Phase 3 fix)"""
     pattern_name = json_data.get('pattern_name', '').lower()
     
     # TYPE-BASED SEVERITY (not volume-based)
     # Sensitive government IDs and financial data
-    if any(kw in pattern_name for kw in ['ssn', 'aadhaar', 'aadhar', 'pan', 'pancard', 'credit_card', 'debit_card', 'passport']):
+    if _GOVERNMENT_FINANCIAL_KEYWORDS.search(pattern_name):
         severity = 'CRITICAL'
         description = 'Sensitive PII detected (government ID or financial data)'
     # Credentials and secrets
-    elif any(kw in pattern_name for kw in ['aws_key', 'api_key', 'secret', 'password', 'token', 'private_key', 'access_key']):
+    elif _CREDENTIAL_KEYWORDS.search(pattern_name):
         severity = 'CRITICAL'
         description = 'Credentials or secrets detected'
     # Personal contact information
-    elif any(kw in pattern_name for kw in ['email', 'phone', 'mobile']):
+    elif _CONTACT_KEYWORDS.search(pattern_name):
         severity = 'HIGH'
         description = 'Personal contact information detected'
     # Other potential PII
@@ -699,7 +931,8 @@ def get_jira_accId(args, email):
     user_query = Query()
 
     # Check if the accountId is already cached
-    cached_user = db.search(user_query.email == email)
+    with _alerts_db_lock:
+        cached_user = db.search(user_query.email == email)
     if cached_user:
         print_debug(args, f"Using cached accountId for {email}: {cached_user[0]['accountId']}")
         return cached_user[0]['accountId']
@@ -709,7 +942,7 @@ def get_jira_accId(args, email):
     auth = (username, api_token)
     headers = {"Content-Type": "application/json"}
 
-    response = requests.get(url, auth=auth, headers=headers)
+    response = get_http_session().get(url, auth=auth, headers=headers)
     if response.status_code == 200:
         data = response.json()
         if len(data):
@@ -717,7 +950,8 @@ def get_jira_accId(args, email):
             print_debug(args, f"Found accountId for {email}: {account_id}")
 
             # Cache the accountId
-            db.insert({"email": email, "accountId": account_id})
+            with _alerts_db_lock:
+                db.insert({"email": email, "accountId": account_id})
             return account_id
         else:
             print_debug(args, f"No accountId found for {email}.")
@@ -746,7 +980,9 @@ def create_jira_ticket(args, issue_data, message):
                 msg_hash = calculate_msg_hash(message)
                 # Check if the message hash already exists in the previous alerts database
                 alert_query = Query()
-                if db.search(alert_query['msg_hash'] == msg_hash):
+                with _alerts_db_lock:
+                    duplicate = db.search(alert_query['msg_hash'] == msg_hash)
+                if duplicate:
                     print_info(args, "Duplicate message detected. Skipping ticket creation")
                     return
 
@@ -798,7 +1034,7 @@ def create_jira_ticket(args, issue_data, message):
     auth = (username, api_token)
     headers = {"Content-Type": "application/json"}
 
-    response = requests.post(url, json=payload, auth=auth, headers=headers)
+    response = get_http_session().post(url, json=payload, auth=auth, headers=headers)
     if response.status_code == 201:
         print_debug(args, f"Jira ticket created successfully: {response.json().get('key')}")
     else:
@@ -7,29 +7,49 @@ This module bridges the gap between the regex-based pattern matching
 and the mathematical validators in the SDK.
 
 INTELLIGENCE-AT-EDGE: Only validated findings are returned.
+
+Format validators (email) are not redundant with the regexes: the
+fingerprint Email pattern accepts values like "a..b@x.com" that
+validate_email rejects, so every in-scope pattern is validated.
 """
 
 import re
 import sys
 import os
-from typing import Optional, List, Dict, Any
+import functools
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from sdk.validators import validate_aadhaar, validate_credit_card, validate_pan
+from sdk.validators import validate_aadhaar_batch, validate_credit_card_batch
 from sdk.validators import validate_email, IndianPhoneValidator
 from sdk.validators import IndianPassportValidator
 
 
+# Validators are pure functions of the matched string, so values that repeat
+# across findings and files are validated once
+_memoize = functools.lru_cache(maxsize=8192)
+
 VALIDATOR_MAP = {
-    "IN_AADHAAR": validate_aadhaar,
-    "IN_PAN": validate_pan,
-    "CREDIT_CARD": validate_credit_card,
-    "EMAIL_ADDRESS": validate_email,
-    "IN_PHONE": IndianPhoneValidator.validate,
-    "IN_PASSPORT": IndianPassportValidator.validate,
+    "IN_AADHAAR": _memoize(validate_aadhaar),
+    "IN_PAN": _memoize(validate_pan),
+    "CREDIT_CARD": _memoize(validate_credit_card),
+    "EMAIL_ADDRESS": _memoize(validate_email),
+    "IN_PHONE": _memoize(IndianPhoneValidator.validate),
+    "IN_PASSPORT": _memoize(IndianPassportValidator.validate),
+}
+
+# Checksum validators with a batched (numpy/Numba) equivalent
+BATCH_VALIDATOR_MAP = {
+    VALIDATOR_MAP["IN_AADHAAR"]: validate_aadhaar_batch,
+    VALIDATOR_MAP["CREDIT_CARD"]: validate_credit_card_batch,
 }
 
+# Below this many matches the per-match loop beats the batch setup cost
+_BATCH_MIN_MATCHES = 4
+
 
 PII_TYPE_PATTERNS = {
     'AADHAAR': r'(?:^|[^0-9])([2-9]{1}[0-9]{3}[0-9]{4}[0-9]{4})(?![0-9])',
@@ -46,6 +66,19 @@ PII_TYPE_PATTERNS = {
 }
 
 
+# Compiled fingerprint regexes, keyed by (regex, flags); shared across scans
+_COMPILED_CACHE: Dict[tuple, re.Pattern] = {}
+
+
+def _get_compiled(pattern_regex: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile a pattern once per process instead of on every scan."""
+    key = (pattern_regex, flags)
+    compiled = _COMPILED_CACHE.get(key)
+    if compiled is None:
+        compiled = _COMPILED_CACHE[key] = re.compile(pattern_regex, flags)
+    return compiled
+
+
 # Strict PII Scope - Only these types are allowed
 ALLOWED_PII_TYPES = {
     'IN_AADHAAR',
@@ -98,13 +131,34 @@ def validate_match(value: str, pattern_name: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, validation_method)
     """
+    validator, method = _resolve_validator(pattern_name)
+    if validator is None:
+        return False, method
+    
+    try:
+        return validator(value), method
+    except Exception as e:
+        # 3. EXCEPTION HANDLING: Fail closed
+        print(f"[VALIDATION ERROR] {pattern_name}: {e}")
+        return False, 'error'
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_validator(pattern_name: str) -> tuple:
+    """
+    Scope check and validator lookup for a pattern name, done once per name.
+    
+    Returns:
+        Tuple of (validator, validation_method); validator is None when the
+        method is 'scope_rejected' or 'no_validator'
+    """
     # 1. SCOPE CHECK: Enforce strict PII locking
     normalized_name = get_normalized_name(pattern_name)
     
     if normalized_name not in ALLOWED_PII_TYPES:
         # Check if original was allowed (just in case)
         if pattern_name.upper() not in ALLOWED_PII_TYPES:
-             return False, 'scope_rejected'
+             return None, 'scope_rejected'
 
     validator = get_validator_for_pattern(pattern_name)
     
@@ -113,16 +167,92 @@ def validate_match(value: str, pattern_name: str) -> tuple[bool, str]:
         # In strict mode, we should reject. 
         # But if it's in ALLOWED_PII_TYPES but missing validator map entry, that's a bug or config issue.
         # Given we have validators for all ALLOWED types above, this is safe.
-        return False, 'no_validator'
+        return None, 'no_validator'
     
-    try:
-        is_valid = validator(value)
-        method = validator.__name__
-        return is_valid, method
-    except Exception as e:
-        # 3. EXCEPTION HANDLING: Fail closed
-        print(f"[VALIDATION ERROR] {pattern_name}: {e}")
-        return False, 'error'
+    return validator, validator.__name__
+
+
+def validate_matches(values: List[str], pattern_name: str) -> List[tuple]:
+    """
+    Validate all matches of one pattern, batching checksum validators.
+    
+    The scope check and validator lookup run once for the whole list.
+    
+    Args:
+        values: Matched values for the pattern
+        pattern_name: The pattern name (e.g., 'Aadhaar', 'PAN')
+        
+    Returns:
+        List of (is_valid, validation_method), in input order
+    """
+    validator, method = _resolve_validator(pattern_name)
+    if validator is None:
+        return [(False, method)] * len(values)
+    
+    batch_validator = BATCH_VALIDATOR_MAP.get(validator)
+    if batch_validator is not None and len(values) >= _BATCH_MIN_MATCHES:
+        try:
+            return [(is_valid, method) for is_valid in batch_validator(values)]
+        except Exception:
+            # Per-match path below reports which value failed
+            pass
+    
+    results = []
+    for value in values:
+        try:
+            results.append((validator(value), method))
+        except Exception as e:
+            print(f"[VALIDATION ERROR] {pattern_name}: {e}")
+            results.append((False, 'error'))
+    return results
+
+
+def iter_validated_findings(findings: Iterable[Dict[str, Any]], args=None,
+                            strict_mode: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Validate findings lazily, yielding each one that keeps a valid match.
+    
+    Findings are validated as they are consumed, so callers that handle one
+    finding at a time never hold the whole validated list.
+    
+    Args:
+        findings: Iterable of finding dictionaries from match_strings()
+        args: Command line arguments for debug output
+        strict_mode: If True, reject findings without validators
+        
+    Yields:
+        Validated findings, updated in place
+    """
+    debug = bool(args and getattr(args, 'debug', False))
+    
+    for finding in findings:
+        pattern_name = finding.get('pattern_name', '')
+        original_matches = finding.get('matches', [])
+        # Out-of-scope or validator-less patterns fail closed; skip their matches entirely
+        if not debug and _resolve_validator(pattern_name)[0] is None:
+            continue
+        # Validate (and report) each distinct value once, keeping first-seen order
+        matches = list(dict.fromkeys(original_matches))
+        validated_matches = []
+        # Method -> truncated samples; samples are only collected for debug output
+        validation_info = defaultdict(list)
+        
+        for match, (is_valid, method) in zip(matches, validate_matches(matches, pattern_name)):
+            if is_valid:
+                validated_matches.append(match)
+                samples = validation_info[method]
+                if debug:
+                    samples.append(match[:10] + '...' if len(match) > 10 else match)
+            elif debug:
+                print(f"[VALIDATION REJECTED] {pattern_name}: {match[:20]}...")
+        
+        if validated_matches:
+            # Findings are freshly built by the matchers, so they are updated in place
+            finding['matches'] = validated_matches
+            finding['validation_method'] = dict(validation_info)
+            finding['original_match_count'] = len(original_matches)
+            finding['validated_match_count'] = len(validated_matches)
+            yield finding
 
 
 def validate_findings(findings: List[Dict[str, Any]], args=None, strict_mode: bool = False) -> List[Dict[str, Any]]:
@@ -142,35 +272,8 @@ def validate_findings(findings: List[Dict[str, Any]], args=None, strict_mode: bo
     Returns:
         List of validated findings only
     """
-    validated_findings = []
+    validated_findings = list(iter_validated_findings(findings, args, strict_mode))
     total_original = len(findings)
-    
-    for finding in findings:
-        pattern_name = finding.get('pattern_name', '')
-        matches = finding.get('matches', [])
-        validated_matches = []
-        validation_info = {}
-        
-        for match in matches:
-            is_valid, method = validate_match(match, pattern_name)
-            
-            if is_valid:
-                validated_matches.append(match)
-                if method not in validation_info:
-                    validation_info[method] = []
-                validation_info[method].append(match[:10] + '...' if len(match) > 10 else match)
-            else:
-                if args and hasattr(args, 'debug') and args.debug:
-                    print(f"[VALIDATION REJECTED] {pattern_name}: {match[:20]}...")
-        
-        if validated_matches:
-            finding_copy = finding.copy()
-            finding_copy['matches'] = validated_matches
-            finding_copy['validation_method'] = validation_info
-            finding_copy['original_match_count'] = len(matches)
-            finding_copy['validated_match_count'] = len(validated_matches)
-            validated_findings.append(finding_copy)
-    
     rejected_count = total_original - len(validated_findings)
     
     if args and not args.quiet:
@@ -193,14 +296,13 @@ def validate_and_enhance_result(result: Dict[str, Any], args=None) -> Optional[D
         Enhanced result or None if invalid
     """
     pattern_name = result.get('pattern_name', '')
-    matches = result.get('matches', [])
+    matches = list(dict.fromkeys(result.get('matches', [])))
     
     if not matches:
         return result
     
     validated_matches = []
-    for match in matches:
-        is_valid, method = validate_match(match, pattern_name)
+    for match, (is_valid, method) in zip(matches, validate_matches(matches, pattern_name)):
         if is_valid:
             validated_matches.append(match)
     
@@ -214,6 +316,40 @@ def validate_and_enhance_result(result: Dict[str, Any], args=None) -> Optional[D
     return result
 
 
+def _unique_matches(compiled_regex: re.Pattern, content: str) -> set:
+    """
+    Returns the distinct values findall() would return, without building its list.
+    
+    Like findall, values are the whole match, the single group, or a tuple of
+    groups (unmatched groups as '').
+    """
+    match_iter = compiled_regex.finditer(content)
+    if compiled_regex.groups == 0:
+        return {match_obj.group() for match_obj in match_iter}
+    if compiled_regex.groups == 1:
+        return {match_obj.group(1) or '' for match_obj in match_iter}
+    return {match_obj.groups('') for match_obj in match_iter}
+
+
+def _findall_patterns(content: str, pattern_regexes: List[str]) -> List[set]:
+    """
+    Collects the distinct matches of each regex over content.
+    
+    Runs sequentially on purpose: large content comes from the fs scan, which
+    already scans one file per process on every core, so a process pool here
+    would only oversubscribe them.
+    
+    Returns:
+        One set of matches per regex, in input order
+    """
+    from hawk_scanner.internals.scanner_engine import case_flags
+    
+    # IGNORECASE is dropped where it can't change the matches, keeping re's fast paths
+    ascii_content = content.isascii()
+    return [_unique_matches(_get_compiled(pattern_regex, case_flags(pattern_regex, ascii_content)), content)
+            for pattern_regex in pattern_regexes]
+
+
 def run_validated_scan(args, content: str, source: str = 'text') -> List[Dict[str, Any]]:
     """
     Run a complete validated scan with SDK validation.
@@ -229,20 +365,27 @@ def run_validated_scan(args, content: str, source: str = 'text') -> List[Dict[st
     Returns:
         List of validated findings
     """
-    from hawk_scanner.internals import system
+    from hawk_scanner.internals import system, scanner_engine
     
     patterns = system.get_fingerprint_file(args)
     matched_strings = []
     
-    for pattern_name, pattern_regex in patterns.items():
-        compiled_regex = re.compile(pattern_regex, re.IGNORECASE)
-        matches = re.findall(compiled_regex, content)
-        
+    # One Hyperscan pass narrows the catalog to patterns that can match content;
+    # without it, patterns whose required literal is absent are skipped
+    pattern_db = system.get_pattern_db(patterns)
+    if pattern_db is not None:
+        candidates = pattern_db.matching_patterns(patterns, content)
+    else:
+        candidates = scanner_engine.literal_prefilter(patterns, content)
+    
+    all_matches = _findall_patterns(content, list(candidates.values()))
+    
+    for pattern_name, matches in zip(candidates, all_matches):
         if matches:
             found = {
                 'data_source': source,
                 'pattern_name': pattern_name,
-                'matches': list(set(matches)),
+                'matches': list(matches),
                 'sample_text': content[:100],
             }
             matched_strings.append(found)
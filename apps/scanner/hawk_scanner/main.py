@@ -1,14 +1,17 @@
 import sys
 import os
 import json
+import contextlib
 import yaml
 import importlib
 import time
+import threading
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from collections import defaultdict
+from collections import ChainMap, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from hawk_scanner.internals import system
 from rich import print
 # SSL verification is enabled by default
@@ -37,16 +40,19 @@ def execute_command(command, args):
 
 def group_results(args, results):
     grouped_results = defaultdict(list)
+    connection = system.get_connection(args)
     for result in results:
-        connection = system.get_connection(args)
+        # Results unpickled from worker processes each carry their own copies of these keys
+        result['data_source'] = sys.intern(result['data_source'])
+        if 'pattern_name' in result:
+            result['pattern_name'] = sys.intern(result['pattern_name'])
         result = system.evaluate_severity(result, connection)
         grouped_results[result['data_source']].append(result)
     return grouped_results
 
 
-def format_slack_message(group, result, records_mini, mention):
-    template_map = {
-        's3': """
+_SLACK_TEMPLATES = {
+    's3': """
         *** PII Or Secret Found ***
         Data Source: S3 Bucket - {vulnerable_profile}
         Bucket: {bucket}
@@ -55,7 +61,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'mysql': """
+    'mysql': """
         *** PII Or Secret Found ***
         Data Source: MySQL - {vulnerable_profile}
         Host: {host}
@@ -66,7 +72,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'postgresql': """
+    'postgresql': """
         *** PII Or Secret Found ***
         Data Source: PostgreSQL - {vulnerable_profile}
         Host: {host}
@@ -77,7 +83,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'mongodb': """
+    'mongodb': """
         *** PII Or Secret Found ***
         Data Source: MongoDB - {vulnerable_profile}
         Host: {host}
@@ -88,7 +94,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'redis': """
+    'redis': """
         *** PII Or Secret Found ***
         Data Source: Redis - {vulnerable_profile}
         Host: {host}
@@ -97,7 +103,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'firebase': """
+    'firebase': """
         *** PII Or Secret Found ***
         Data Source: Firebase - {vulnerable_profile}
         Bucket: {bucket}
@@ -106,7 +112,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'gcs': """
+    'gcs': """
         *** PII Or Secret Found ***
         Data Source: GCS - {vulnerable_profile}
         Bucket: {bucket}
@@ -115,7 +121,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'fs': """
+    'fs': """
         *** PII Or Secret Found ***
         Data Source: File System - {vulnerable_profile}
         File Path: {file_path}
@@ -123,7 +129,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'slack': """
+    'slack': """
         *** PII Or Secret Found ***
         Data Source: Slack - {vulnerable_profile}
         Channel Name: {channel_name}
@@ -132,7 +138,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'couchdb': """
+    'couchdb': """
         *** PII Or Secret Found ***
         Data Source: CouchDB - {vulnerable_profile}
         Host: {host}
@@ -143,7 +149,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'gdrive': """
+    'gdrive': """
         *** PII Or Secret Found ***
         Data Source: Google Drive - {vulnerable_profile}
         File Name: {file_name}
@@ -151,7 +157,7 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'gdrive_workspace': """
+    'gdrive_workspace': """
         *** PII Or Secret Found ***
         Data Source: Google Drive Workspace - {vulnerable_profile}
         File Name: {file_name}
@@ -160,31 +166,33 @@ def format_slack_message(group, result, records_mini, mention):
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """,
-        'text': """
+    'text': """
         *** PII Or Secret Found ***
         Data Source: Text - {vulnerable_profile}
         Pattern Name: {pattern_name}
         Total Exposed: {total_exposed}
         Exposed Values: {exposed_values}
         """
-    }
-    return f"{mention} " + template_map.get(group, "").format(
-        vulnerable_profile=result['profile'],
-        bucket=result.get('bucket', ''),
-        file_path=result.get('file_path', ''),
-        host=result.get('host', ''),
-        database=result.get('database', ''),
-        table=result.get('table', ''),
-        column=result.get('column', ''),
-        doc_id=result.get('doc_id', ''),
-        channel_name=result.get('channel_name', ''),
-        message_link=result.get('message_link', ''),
-        file_name=result.get('file_name', ''),
-        user=result.get('user', ''),
-        pattern_name=result['pattern_name'],
-        total_exposed=str(len(result['matches'])),
-        exposed_values=records_mini
-    )
+}
+# Bound format_map per group, so no template lookup or kwargs dict per message
+_SLACK_FORMATTERS = {group: template.format_map for group, template in _SLACK_TEMPLATES.items()}
+# Location fields a result may lack, rendered as empty strings
+_SLACK_DEFAULTS = dict.fromkeys([
+    'bucket', 'file_path', 'host', 'database', 'table', 'column', 'collection', 'field',
+    'key', 'doc_id', 'channel_name', 'message_link', 'file_name', 'user',
+], '')
+
+
+def format_slack_message(group, result, records_mini, mention):
+    formatter = _SLACK_FORMATTERS.get(group)
+    if formatter is None:
+        return f"{mention} "
+    return f"{mention} " + formatter(ChainMap({
+        'vulnerable_profile': result['profile'],
+        'pattern_name': result['pattern_name'],
+        'total_exposed': str(len(result['matches'])),
+        'exposed_values': records_mini,
+    }, result, _SLACK_DEFAULTS))
 
 
 def add_columns_to_table(group, table):
@@ -213,6 +221,100 @@ def add_columns_to_table(group, table):
     table.add_column("Sample Text")
 
 
+CSV_HEADER = ["Sl. No.", "Data Source", "Vulnerable Profile", "Location", "Pattern Name", "Match Value", "Sample Text", "Severity", "Severity Description"]
+# Position of the matches list in a write_csv_report record
+_CSV_MATCHES = 4
+
+
+def csv_location(group, result):
+    # Construct Location string based on group type
+    location = ""
+    if group in ['s3', 'firebase', 'gcs']:
+        location = f"{result.get('bucket', '')} > {result.get('file_path', '')}"
+    elif group in ['mysql', 'postgresql']:
+        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('table', '')}.{result.get('column', '')}"
+    elif group == 'mongodb':
+        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('collection', '')} > {result.get('field', '')}"
+    elif group == 'redis':
+        location = f"{result.get('host', '')} > {result.get('key', '')}"
+    elif group == 'slack':
+        location = f"{result.get('channel_name', '')} > {result.get('message_link', '')}"
+    elif group == 'couchdb':
+        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('doc_id', '')} > {result.get('field', '')}"
+    elif group == 'gdrive':
+        location = f"{result.get('file_name', '')}"
+    elif group == 'gdrive_workspace':
+        location = f"{result.get('file_name', '')} (User: {result.get('user', '')})"
+    elif group == 'fs':
+        location = result.get('file_path', '')
+    elif group == 'text':
+        location = "Text Input"
+    return location
+
+
+def _csv_text(value):
+    # Same conversion csv.writer applies to non-string fields, done up front so both writers quote it
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def write_csv_report(path, records):
+    """
+    Write one CSV row per match.
+
+    records are (group, profile, location, pattern_name, matches, sample_text,
+    severity, severity_description) tuples. With pyarrow installed the rows go
+    through its C CSV writer as columns; otherwise the csv module writes them.
+    Both produce the same file: every field but the serial number is quoted
+    and lines end in '\n'.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa = None
+
+    if pa is None:
+        import csv
+        with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
+            # pyarrow's quoting: strings always, numbers (only the serial) never
+            writer = csv.writer(file, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+            writer.writerow(CSV_HEADER)
+            i = 1
+            for record in records:
+                head = [_csv_text(value) for value in record[:_CSV_MATCHES]]
+                tail = [_csv_text(value) for value in record[_CSV_MATCHES + 1:]]
+                matches = record[_CSV_MATCHES]
+                # Explode matches into individual rows; only the serial number and match vary
+                writer.writerows(
+                    (serial, *head, _csv_text(match), *tail)
+                    for serial, match in enumerate(matches, i)
+                )
+                i += len(matches)
+        return
+
+    # Columnar: per-result fields are repeated once per match
+    columns = [[] for _ in CSV_HEADER[1:]]
+    for record in records:
+        count = len(record[_CSV_MATCHES])
+        for idx, (column, value) in enumerate(zip(columns, record)):
+            if idx == _CSV_MATCHES:
+                column.extend(map(_csv_text, value))
+            else:
+                column.extend([_csv_text(value)] * count)
+    serials = pa.array(range(1, len(columns[_CSV_MATCHES]) + 1), type=pa.int64())
+    table = pa.table([serials] + [pa.array(column, type=pa.string()) for column in columns], names=CSV_HEADER)
+    pa_csv.write_csv(table, path)
+
+
+def write_json_lines(file, grouped_results):
+    """Writes one {"<source>": result} JSON object per line and flushes."""
+    file.writelines(json.dumps({group: result}) + '\n'
+                    for group, group_data in grouped_results.items() for result in group_data)
+    file.flush()
+
+
 def main():
     start_time = time.time()
 
@@ -242,9 +344,21 @@ def main():
     results = []
     
     if args.command:
+        # Compile the pattern catalog in the background while sources are connected and listed
+        threading.Thread(target=system.warmup, args=(system.get_fingerprint_file(args),),
+                         name="hawk-warmup", daemon=True).start()
         connections = system.get_connection(args)
         data_sources = connections.get('sources', {}).keys()
         commands = [args.command] if args.command != 'all' else data_sources
+        if args.json_lines:
+            to_stdout = args.json_lines == '-'
+            with (contextlib.nullcontext(sys.stdout) if to_stdout else open(args.json_lines, 'w')) as json_lines:
+                for command in commands:
+                    # Emit each source as soon as it is scanned so consumers can start early
+                    write_json_lines(json_lines, group_results(args, execute_command(command, args)))
+            if not to_stdout:
+                system.print_success(args, f"Results saved to {args.json_lines}")
+            sys.exit(0)
         for command in commands:
             results.extend(execute_command(command, args))
     else:
@@ -262,51 +376,20 @@ def main():
         sys.exit(0)
 
     if args.csv:
-        import csv
-        with open(args.csv, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(["Sl. No.", "Data Source", "Vulnerable Profile", "Location", "Pattern Name", "Match Value", "Sample Text", "Severity", "Severity Description"])
-            
-            i = 1
-            for group, group_data in grouped_results.items():
-                for result in group_data:
-                    # Construct Location string based on group type
-                    location = ""
-                    if group in ['s3', 'firebase', 'gcs']:
-                        location = f"{result.get('bucket', '')} > {result.get('file_path', '')}"
-                    elif group in ['mysql', 'postgresql']:
-                        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('table', '')}.{result.get('column', '')}"
-                    elif group == 'mongodb':
-                        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('collection', '')} > {result.get('field', '')}"
-                    elif group == 'redis':
-                        location = f"{result.get('host', '')} > {result.get('key', '')}"
-                    elif group == 'slack':
-                        location = f"{result.get('channel_name', '')} > {result.get('message_link', '')}"
-                    elif group == 'couchdb':
-                        location = f"{result.get('host', '')} > {result.get('database', '')} > {result.get('doc_id', '')} > {result.get('field', '')}"
-                    elif group == 'gdrive':
-                        location = f"{result.get('file_name', '')}"
-                    elif group == 'gdrive_workspace':
-                        location = f"{result.get('file_name', '')} (User: {result.get('user', '')})"
-                    elif group == 'fs':
-                        location = result.get('file_path', '')
-                    elif group == 'text':
-                        location = "Text Input"
-                    
-                    # Explode matches into individual rows
-                    for match in result['matches']:
-                        writer.writerow([
-                            i,
-                            group,
-                            result.get('profile', ''),
-                            location,
-                            result.get('pattern_name', ''),
-                            match,
-                            result.get('sample_text', ''),
-                            result.get('severity', 'unknown'),
-                            result.get('severity_description', '')
-                        ])
-                        i += 1
+        records = []
+        for group, group_data in grouped_results.items():
+            for result in group_data:
+                records.append((
+                    group,
+                    result.get('profile', ''),
+                    csv_location(group, result),
+                    result.get('pattern_name', ''),
+                    result['matches'],
+                    result.get('sample_text', ''),
+                    result.get('severity', 'unknown'),
+                    result.get('severity_description', '')
+                ))
+        write_csv_report(args.csv, records)
         system.print_success(args, f"Results saved to {args.csv}")
         sys.exit(0)
 
@@ -314,9 +397,36 @@ def main():
         print(json.dumps(grouped_results, indent=4))
         sys.exit(0)
 
+    # NEW: Auto-ingestion to backend API, overlapped with the table/notification output below
+    ingest_thread = None
+    if hasattr(args, 'ingest_url') and args.ingest_url:
+        from hawk_scanner.internals.auto_ingest import start_background_ingestion, validate_ingest_url
+        
+        if validate_ingest_url(args.ingest_url):
+            scan_metadata = {
+                "scanner_version": "hawk-eye-scanner",
+                "scan_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "command": args.command,
+                "execution_time": time.time() - start_time,
+                "total_findings": sum(len(results) for results in grouped_results.values())
+            }
+            ingest_thread = start_background_ingestion(args, grouped_results, scan_metadata)
+        else:
+            console.print(f"[bold red]❌ Invalid ingestion URL: {args.ingest_url}[/bold red]")
+            console.print("[yellow]URL should end with /ingest, /api/v1/ingest, or /api/ingest[/yellow]")
+
     # Display results in the table format
     console.print(Panel(Text("Now, let's look at findings!", justify="center")))
 
+    # Jira/Slack calls are network-bound; send them in the background so rendering never waits on them
+    notify_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hawk-notify")
+    notify_futures = []
+    connection = system.get_connection(args)
+    notify_config = connection.get('notify', {})
+    mention = notify_config.get('slack', {}).get('mention', '')
+    # Skip building messages when neither a Slack webhook nor Jira is configured
+    notify_enabled = bool(notify_config.get('slack', {}).get('webhook_url') or notify_config.get('jira', {}).get('username'))
+
     for group, group_data in grouped_results.items():
         table = Table(show_header=True, header_style="bold magenta", show_lines=True, 
                       title=f"[bold blue]Total {len(group_data)} findings in {group}[/bold blue]")
@@ -325,12 +435,9 @@ def main():
         add_columns_to_table(group, table)
         for i, result in enumerate(group_data, 1):
             records_mini = ', '.join(result['matches']) if len(result['matches']) < 25 else ', '.join(result['matches'][:25]) + f" + {len(result['matches']) - 25} more"
-            connection = system.get_connection(args)
-            mention = connection.get('notify', {}).get('slack', {}).get('mention', '')
-            slack_message = format_slack_message(group, result, records_mini, mention)
-            if slack_message:
-                system.create_jira_ticket(args, result, slack_message)
-                system.SlackNotify(slack_message, args)
+            if notify_enabled:
+                slack_message = format_slack_message(group, result, records_mini, mention)
+                notify_futures.append(notify_pool.submit(system.notify_finding, args, result, slack_message))
 
             if group == 's3':
                 table.add_row(str(i), result['profile'], f"{result['bucket']} > {result['file_path']}",
@@ -372,22 +479,13 @@ def main():
 
         console.print(table)
 
-    # NEW: Auto-ingestion to backend API
-    if hasattr(args, 'ingest_url') and args.ingest_url:
-        from hawk_scanner.internals.auto_ingest import ingest_scan_results, validate_ingest_url
-        
-        if validate_ingest_url(args.ingest_url):
-            scan_metadata = {
-                "scanner_version": "hawk-eye-scanner",
-                "scan_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "command": args.command,
-                "execution_time": time.time() - start_time,
-                "total_findings": sum(len(results) for results in grouped_results.values())
-            }
-            ingest_scan_results(args, grouped_results, scan_metadata)
-        else:
-            console.print(f"[bold red]❌ Invalid ingestion URL: {args.ingest_url}[/bold red]")
-            console.print("[yellow]URL should end with /ingest, /api/v1/ingest, or /api/ingest[/yellow]")
+    notify_pool.shutdown(wait=True)
+    for future in notify_futures:
+        if future.exception():
+            system.print_error(args, f"Notification failed: {future.exception()}")
+
+    if ingest_thread:
+        ingest_thread.join()
 
     if args.hawk_thuu:
         console.print("Hawk thuuu, Spitting on that thang!....")
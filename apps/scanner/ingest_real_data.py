@@ -7,6 +7,14 @@ import requests
 import json
 import time
 from datetime import datetime
+from hawk_scanner.internals.auto_ingest import encode_payload
+
+# One pooled connection reused across ingestions
+session = requests.Session()
+session.headers.update({'Content-Type': 'application/json'})
+
+# Pattern types sent to the backend
+INGESTED_PATTERNS = {'IN_AADHAAR', 'IN_PAN', 'EMAIL_ADDRESS'}
 
 def ingest_real_scan_results():
     """Send real PII findings to backend"""
@@ -21,41 +29,23 @@ def ingest_real_scan_results():
     # Prepare findings in backend format
     findings = []
     
-    # Process Aadhaar findings
-    if 'fs' in scan_data:
-        for result in scan_data['fs']:
-            if result['pattern_name'] == 'IN_AADHAAR':
-                for match in result['matches']:
-                    findings.append({
-                        "pattern_name": "IN_AADHAAR",
-                        "matches": [match],  # Backend expects list
-                        "sample_text": result['sample_text'],
-                        "confidence_score": result['validation_method']['confidence'],
-                        "validation_method": json.dumps(result['validation_method']),
-                        "validated": True
-                    })
-            
-            elif result['pattern_name'] == 'IN_PAN':
-                for match in result['matches']:
-                    findings.append({
-                        "pattern_name": "IN_PAN", 
-                        "matches": [match],
-                        "sample_text": result['sample_text'],
-                        "confidence_score": result['validation_method']['confidence'],
-                        "validation_method": json.dumps(result['validation_method']),
-                        "validated": True
-                    })
-            
-            elif result['pattern_name'] == 'EMAIL_ADDRESS':
-                for match in result['matches']:
-                    findings.append({
-                        "pattern_name": "EMAIL_ADDRESS",
-                        "matches": [match], 
-                        "sample_text": result['sample_text'],
-                        "confidence_score": result['validation_method']['confidence'],
-                        "validation_method": json.dumps(result['validation_method']),
-                        "validated": True
-                    })
+    # Process Aadhaar, PAN and email findings
+    for result in scan_data.get('fs', []):
+        pattern_name = result['pattern_name']
+        if pattern_name not in INGESTED_PATTERNS or not result['matches']:
+            continue
+        # Shared by every match of this result
+        confidence_score = result['validation_method']['confidence']
+        validation_method = json.dumps(result['validation_method'])
+        sample_text = result['sample_text']
+        findings.extend({
+            "pattern_name": pattern_name,
+            "matches": [match],  # Backend expects list
+            "sample_text": sample_text,
+            "confidence_score": confidence_score,
+            "validation_method": validation_method,
+            "validated": True
+        } for match in result['matches'])
     
     # Create scan payload
     payload = {
@@ -76,12 +66,9 @@ def ingest_real_scan_results():
     
     # Send to backend
     try:
-        response = requests.post(
-            ingest_url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
+        # orjson (when installed) + gzip; the backend inflates Content-Encoding: gzip bodies
+        body, headers = encode_payload(payload, compress=True)
+        response = session.post(ingest_url, data=body, headers=headers, timeout=30)
         
         if response.status_code == 200:
             print("✅ SUCCESS: Real PII findings ingested successfully!")
@@ -3,27 +3,84 @@ Scanner HTTP API Service
 Provides REST API for triggering scans and ingesting results into the backend.
 """
 import os
+import re
 import json
-import subprocess
+import concurrent.futures
+import functools
 import threading
-import tempfile
+import time
+import queue
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
 from datetime import datetime
+from hawk_scanner.commands import fs as hawk_fs
+from hawk_scanner.internals.auto_ingest import encode_payload
+from hawk_scanner.internals import system as hawk_system
 
 app = Flask(__name__)
 
-# Global state for tracking scans
-active_scans = {}
+# Global state for tracking scans, oldest first. Written from request and scan/ingest
+# threads, so every access holds _scans_lock
+active_scans = OrderedDict()
+_scans_lock = threading.RLock()
+# Finished scans beyond this many are forgotten, oldest first; running scans are always kept
+MAX_TRACKED_SCANS = int(os.getenv('MAX_TRACKED_SCANS', 10000))
+
+# Bounded scan pool: bursts of scan requests queue here instead of each starting a thread
+SCAN_WORKERS = int(os.getenv('SCAN_WORKERS', os.cpu_count() or 4))
+EXEC = concurrent.futures.ThreadPoolExecutor(
+    max_workers=SCAN_WORKERS,
+    thread_name_prefix='scan'
+)
+# Each scan's ingest consumer, and its completion notify, run here while the scan produces
+# findings. Always the scan pool's size, so every running scan has a consumer draining its queue
+INGEST_EXEC = concurrent.futures.ThreadPoolExecutor(
+    max_workers=SCAN_WORKERS,
+    thread_name_prefix='ingest'
+)
+# Wall-clock limit in seconds for a single scan; a scan over it is marked failed
+SCAN_TIMEOUT = int(os.getenv('SCAN_TIMEOUT', 600))
+# Findings a scan may run ahead of its ingest consumer before it blocks
+INGEST_QUEUE_SIZE = int(os.getenv('INGEST_QUEUE_SIZE', 1000))
+# Put on a scan's findings queue once the scan has ended, successfully or not
+_SCAN_END = object()
+# Futures of scans not yet finished, kept apart from active_scans since they are not JSON-serializable
+scan_futures = {}
+
+SCANNER_VERSION = '0.3.39'
 
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://backend:8080')
+# Findings per ingest POST; 0 sends one request. The backend opens a scan run per
+# POST (all tagged with the same scan_id), so batching is opt-in. A failed scan posts
+# nothing further, but batches sent before it failed stay ingested
+INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', 0))
+
+# Shared session: scan threads reuse keep-alive connections to the backend.
+# Retry replays connection failures; status retries apply to idempotent methods only,
+# so an ingest POST the backend already received is never resent
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                       max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Load and compile the pattern catalog at import. Under gunicorn --preload this runs once
+# in the master, so workers start with it built and the first /scan pays no compile cost
+try:
+    hawk_system.warmup(hawk_system.get_fingerprint_file())
+except (Exception, SystemExit) as e:
+    # get_fingerprint_file exits when no catalog can be found or downloaded
+    print(f"[Scanner] Pattern warmup failed, compiling on first scan: {e}")
 
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({
         'status': 'healthy',
         'service': 'arc-hawk-scanner',
-        'version': '0.3.39'
+        'version': SCANNER_VERSION
     })
 
 @app.route('/scan', methods=['POST'])
@@ -44,15 +101,19 @@ def trigger_scan():
         scan_id = config.get('scan_id', f'scan_{int(datetime.now().timestamp())}')
         
         # Mark scan as running
-        active_scans[scan_id] = {
-            'status': 'running',
-            'started_at': datetime.now().isoformat(),
-            'config': config
-        }
+        with _scans_lock:
+            active_scans.pop(scan_id, None)
+            active_scans[scan_id] = {
+                'status': 'running',
+                'started_at': datetime.now().isoformat(),
+                'config': config
+            }
+            _evict_finished_scans()
         
-        # Execute scan in background thread
-        thread = threading.Thread(target=execute_scan, args=(scan_id, config))
-        thread.start()
+        # Execute scan on the scan pool
+        future = EXEC.submit(execute_scan, scan_id, config)
+        scan_futures[scan_id] = future
+        future.add_done_callback(lambda _: scan_futures.pop(scan_id, None))
         
         return jsonify({
             'scan_id': scan_id,
@@ -69,25 +130,49 @@ def trigger_scan():
 @app.route('/scan/<scan_id>/status', methods=['GET'])
 def get_scan_status(scan_id):
     """Get status of a specific scan."""
-    if scan_id in active_scans:
-        return jsonify(active_scans[scan_id])
+    with _scans_lock:
+        status = dict(active_scans[scan_id]) if scan_id in active_scans else None
+    if status is not None:
+        future = scan_futures.get(scan_id)
+        # Still waiting for a free scan worker
+        status['queued'] = future is not None and not (future.running() or future.done())
+        return jsonify(status)
     return jsonify({'status': 'not_found'}), 404
 
 
+def update_scan(scan_id, **fields):
+    """Update a tracked scan's status fields under the lock."""
+    with _scans_lock:
+        active_scans[scan_id].update(fields)
+
+
+def _evict_finished_scans():
+    # Caller holds _scans_lock
+    excess = len(active_scans) - MAX_TRACKED_SCANS
+    if excess <= 0:
+        return
+    victims = []
+    for sid, scan in active_scans.items():
+        if scan['status'] != 'running':
+            victims.append(sid)
+            if len(victims) == excess:
+                break
+    for sid in victims:
+        del active_scans[sid]
+
+
 def execute_scan(scan_id, config):
     """
-    Execute the scan using hawk_scanner CLI.
-    Results are ingested into the backend via API.
+    Execute the scan in-process using hawk_scanner's fs scanner.
+    Findings are streamed through a bounded queue to an ingest consumer,
+    so with INGEST_BATCH_SIZE set, batches are posted while the scan runs.
     """
+    findings = queue.Queue(maxsize=INGEST_QUEUE_SIZE)
+    INGEST_EXEC.submit(finish_scan, scan_id, findings)
+    deadline = time.monotonic() + SCAN_TIMEOUT
     try:
         sources = config.get('sources', [])
         
-        # Create output file for scan results
-        output_file = f'/tmp/scan_output_{scan_id}.json'
-        
-        # Create a temporary connection config for this scan
-        connection_config_path = f'/tmp/connection_{scan_id}.yml'
-        
         # Build connection config structure
         # We assume all sources are filesystem paths for now, or we need source type in request
         # The current request format assumes everything is a path (fs)
@@ -111,129 +196,139 @@ def execute_scan(scan_id, config):
             }
         }
         
-        import yaml
-        with open(connection_config_path, 'w') as f:
-            yaml.dump(connection_data, f)
-            
-        # Build scan command - we use 'fs' as the command since we mapped sources to fs profiles
-        cmd = [
-            'hawk_scanner',
-            'fs',
-            '--json', output_file,
-            '--connection', connection_config_path
-        ]
-            
-        print(f"[Scanner] Executing: {' '.join(cmd)}")
+        print(f"[Scanner] Scanning {len(fs_profiles)} filesystem source(s)")
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
-            
-            print(f"[Scanner] stdout: {result.stdout[:500] if result.stdout else 'empty'}")
-            if result.stderr:
-                print(f"[Scanner] stderr: {result.stderr[:500]}")
-                
-        except subprocess.TimeoutExpired:
-            print(f"[Scanner] Scan timed out")
-            raise
-        except Exception as e:
-            print(f"[Scanner] Error scanning: {e}")
-            raise
-        
-        # Read and ingest results
-        if os.path.exists(output_file):
-            with open(output_file, 'r') as f:
-                scan_results = json.load(f)
-            
-            # Ingest into backend
-            ingest_results(scan_id, scan_results)
-            
-            # Cleanup
-            os.remove(output_file)
-        
-        # Update scan status
-        active_scans[scan_id]['status'] = 'completed'
-        active_scans[scan_id]['completed_at'] = datetime.now().isoformat()
-        
-        # Notify backend of completion
-        try:
-            requests.post(
-                f'{BACKEND_URL}/api/v1/scans/{scan_id}/complete',
-                json={'status': 'completed'},
-                timeout=10
-            )
-        except Exception as e:
-            print(f"[Scanner] Failed to notify backend: {e}")
+        # Findings are transformed to VerifiedScanInput format while the scan is still running
+        for f in hawk_fs.scan_iter(connection_data, timeout=SCAN_TIMEOUT):
+            try:
+                findings.put(to_verified_finding(f), timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                raise TimeoutError(f"ingest fell behind past the {SCAN_TIMEOUT}s scan time limit") from None
         
     except Exception as e:
         print(f"[Scanner] Scan failed: {e}")
-        active_scans[scan_id]['status'] = 'failed'
-        active_scans[scan_id]['error'] = str(e)
+        update_scan(scan_id, status='failed', error=str(e))
+    finally:
+        findings.put(_SCAN_END)
+
 
+def drain_findings(findings):
+    """Yield a scan's findings from its queue until the scan ends."""
+    while True:
+        item = findings.get()
+        if item is _SCAN_END:
+            return
+        yield item
 
-def ingest_results(scan_id, results):
-    """Send scan results to backend for ingestion."""
+
+def scan_failed(scan_id):
+    """True once a scan has failed (or has been evicted, which only happens after it ended)."""
+    with _scans_lock:
+        scan = active_scans.get(scan_id)
+        return scan is None or scan['status'] == 'failed'
+
+
+def finish_scan(scan_id, findings):
+    """Ingest a scan's findings as they arrive, then mark it completed and notify the backend."""
+    ingest_results(scan_id, drain_findings(findings))
+    
+    # A failed scan already has its status and is never reported complete
+    if scan_failed(scan_id):
+        return
+    
+    # Update scan status
+    update_scan(scan_id, status='completed', completed_at=datetime.now().isoformat())
+    
+    # Notify backend of completion
     try:
-        print(f"[Scanner] Raw results keys: {results.keys()}")
-        
-        # Transform results to VerifiedScanInput format
-        verified_findings = []
-        
-        # Process 'fs' (filesystem) results
-        fs_findings = results.get('fs', [])
-        print(f"[Scanner] Found {len(fs_findings)} filesystem findings")
-        
-        for f in fs_findings:
-            # Map pattern name to PII Type (using simple heuristic for now)
-            pattern_name = f.get('pattern_name', 'Unknown')
-            pii_type = map_pattern_to_pii_type(pattern_name)
-            
-            # Create VerifiedFinding
-            vf = {
-                "pii_type": pii_type,
-                "value_hash": "", # Optional
-                "source": {
-                    "path": f.get('file_path', ''),
-                    "line": 0,
-                    "column": "",
-                    "table": "",
-                    "data_source": "fs",
-                    "host": f.get('host', 'localhost')
-                },
-                "validators_passed": ["pattern_match"],
-                "validation_method": "regex",
-                "ml_confidence": 0.95, # Mock high confidence for now
-                "ml_entity_type": pii_type,
-                "context_excerpt": f.get('sample_text', ''),
-                "context_keywords": [],
-                "pattern_name": pattern_name,
-                "detected_at": datetime.now().isoformat(),
-                "scanner_version": "0.3.39",
-                "metadata": f.get('file_data', {})
-            }
-            verified_findings.append(vf)
-            
+        body, headers = encode_payload({'status': 'completed'})
+        SESSION.post(
+            f'{BACKEND_URL}/api/v1/scans/{scan_id}/complete',
+            data=body,
+            headers={'Content-Type': 'application/json', **headers},
+            timeout=10
+        )
+    except Exception as e:
+        print(f"[Scanner] Failed to notify backend: {e}")
+
+
+def to_verified_finding(f):
+    """Transform one hawk_scanner fs finding to the VerifiedFinding format."""
+    # Map pattern name to PII Type (using simple heuristic for now)
+    pattern_name = f.get('pattern_name', 'Unknown')
+    pii_type = map_pattern_to_pii_type(pattern_name)
+    
+    return {
+        "pii_type": pii_type,
+        "value_hash": "", # Optional
+        "source": {
+            "path": f.get('file_path', ''),
+            "line": 0,
+            "column": "",
+            "table": "",
+            "data_source": "fs",
+            "host": f.get('host', 'localhost')
+        },
+        "validators_passed": ["pattern_match"],
+        "validation_method": "regex",
+        "ml_confidence": 0.95, # Mock high confidence for now
+        "ml_entity_type": pii_type,
+        "context_excerpt": f.get('sample_text', ''),
+        "context_keywords": [],
+        "pattern_name": pattern_name,
+        "detected_at": None,  # stamped per batch in post_findings
+        "scanner_version": SCANNER_VERSION,
+        "metadata": f.get('file_data', {})
+    }
+
+
+def ingest_results(scan_id, verified_findings):
+    """Send verified findings to backend for ingestion, INGEST_BATCH_SIZE at a time."""
+    total = 0
+    batch = []
+    # Keep consuming even when a POST fails, or the producing scan would block on a full queue
+    for finding in verified_findings:
+        batch.append(finding)
+        if len(batch) == INGEST_BATCH_SIZE:
+            post_findings(scan_id, batch)
+            total += len(batch)
+            batch = []
+    # The scan has ended: a failed scan's remaining findings are dropped, not ingested
+    # under a scan that never completes. An empty scan sends nothing either; the
+    # backend rejects a POST with no findings
+    if batch and scan_failed(scan_id):
+        print(f"[Scanner] Scan failed, dropping {len(batch)} unsent findings")
+    elif batch:
+        post_findings(scan_id, batch)
+        total += len(batch)
+    print(f"[Scanner] Found {total} filesystem findings")
+
+
+def post_findings(scan_id, batch):
+    """POST one batch of verified findings to the backend."""
+    try:
+        print(f"[Scanner] Sending {len(batch)} verified findings to backend")
+        # One timestamp per batch instead of a datetime.now() per finding
+        detected_at = datetime.now().isoformat()
+        for finding in batch:
+            finding["detected_at"] = detected_at
         payload = {
             "scan_id": scan_id,
-            "findings": verified_findings,
+            "findings": batch,
             "metadata": {}
         }
         
-        print(f"[Scanner] Sending {len(verified_findings)} verified findings to backend")
-        
-        response = requests.post(
+        # orjson when installed; requests' json= would go through stdlib json.dumps
+        body, headers = encode_payload(payload)
+        response = SESSION.post(
             f'{BACKEND_URL}/api/v1/scans/ingest-verified',
-            json=payload,
-            headers={'Content-Type': 'application/json'},
+            data=body,
+            headers={'Content-Type': 'application/json', **headers},
             timeout=60
         )
         
         if response.ok:
-            print(f"[Scanner] Successfully ingested findings")
+            print(f"[Scanner] Successfully ingested {len(batch)} findings")
         else:
             print(f"[Scanner] Ingestion failed: {response.status_code} - {response.text}")
             
@@ -242,16 +337,27 @@ def ingest_results(scan_id, results):
         import traceback
         traceback.print_exc()
 
+# Pattern-name keyword -> backend PII type, in match priority order
+_PII_KEYWORDS = (
+    ('pan', 'IN_PAN'),
+    ('aadhaar', 'IN_AADHAAR'),
+    ('credit', 'CREDIT_CARD'),
+    ('email', 'EMAIL_ADDRESS'),
+    ('phone', 'IN_PHONE'),
+    ('passport', 'IN_PASSPORT'),
+)
+_PII_PRIORITY = {kw: i for i, (kw, _) in enumerate(_PII_KEYWORDS)}
+# Lookahead reports overlapping hits too (e.g. "phonemail"), so priority is kept
+_PII_RE = re.compile('(?=(%s))' % '|'.join(re.escape(kw) for kw, _ in _PII_KEYWORDS), re.IGNORECASE)
+
+# Only a handful of distinct pattern names occur, so repeat findings are a cache hit
+@functools.lru_cache(maxsize=256)
 def map_pattern_to_pii_type(pattern_name):
     """Map hawk_scanner pattern names to backend PII types."""
-    name = pattern_name.lower()
-    if 'pan' in name: return 'IN_PAN'
-    if 'aadhaar' in name: return 'IN_AADHAAR'
-    if 'credit' in name: return 'CREDIT_CARD'
-    if 'email' in name: return 'EMAIL_ADDRESS'
-    if 'phone' in name: return 'IN_PHONE'
-    if 'passport' in name: return 'IN_PASSPORT'
-    return 'UNKNOWN'
+    hits = _PII_RE.findall(pattern_name)
+    if not hits:
+        return 'UNKNOWN'
+    return _PII_KEYWORDS[min(_PII_PRIORITY[h.lower()] for h in hits)][1]
 
 
 if __name__ == '__main__':
@@ -9,10 +9,55 @@ Instead of sending just "123456789012" to Presidio, we send:
 This allows Presidio's NLP to boost confidence based on keywords.
 """
 
+import mmap
+import os
+import re
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# '\n', '\r\n' and a lone '\r' each end a line, as they do for the scanner's
+# str.splitlines(); its rarer breaks (\x0b, \x0c, \x85, \u2028, ...) are not
+_LINE_BREAK = re.compile(rb'\r\n?|\n')
+
+
+# One int64 per line is kept for each cached file, so only a few are held at once
+@lru_cache(maxsize=4)
+def _line_starts(file_path: str, mtime_ns: int, size: int):
+    """Byte offset of every line start, built once per (path, mtime, size)."""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if NUMPY_AVAILABLE:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            breaks = data == 10
+            if mm.find(b'\r') != -1:
+                lone_cr = data == 13
+                lone_cr[:-1] &= ~breaks[1:]
+                breaks |= lone_cr
+                del lone_cr
+            starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+            # The mmap can't close while a view of it is alive
+            del data, breaks
+        else:
+            starts = array('q', [0])
+            starts.extend(m.end() for m in _LINE_BREAK.finditer(mm))
+    if starts[-1] == size:
+        # A trailing line break does not open another line
+        starts = starts[:-1]
+    return starts
+
+
 def extract_context_from_file(file_path: str, line_number: int, window_size: int = 100) -> str:
     """
     Extract context window around a line in a file.
     
+    Only the bytes of the window are mapped and decoded, so huge files are
+    never split into per-line strings.
+    
     Args:
         file_path: Path to the file
         line_number: Line number (1-indexed)
@@ -22,19 +67,26 @@ def extract_context_from_file(file_path: str, line_number: int, window_size: int
         Context string with surrounding lines
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        st = os.stat(file_path)
+        if st.st_size == 0:
+            return ""
+        starts = _line_starts(file_path, st.st_mtime_ns, st.st_size)
         
         # Convert to 0-indexed
         line_idx = line_number - 1
         
         # Calculate window boundaries
         start = max(0, line_idx - window_size)
-        end = min(len(lines), line_idx + window_size + 1)
+        end = min(len(starts), line_idx + window_size + 1)
+        if start >= end:
+            return ""
         
-        # Extract and join context
-        context = ''.join(lines[start:end])
-        return context
+        # Decode only the byte range covering the window
+        byte_start = starts[start]
+        byte_end = starts[end] if end < len(starts) else st.st_size
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            context = mm[byte_start:byte_end].decode('utf-8', errors='ignore')
+        return context.replace('\r\n', '\n').replace('\r', '\n')
     
     except Exception as e:
         # Fallback: return empty context
@@ -56,24 +108,23 @@ def extract_context_from_database_row(row_data: dict, column_name: str, window_c
         Context string
     """
     try:
-        # Build context from row
-        context_parts = []
-        
-        for col, value in row_data.items():
-            if col == column_name:
-                # Include the PII column
-                context_parts.append(f"{col}: {value}")
-            else:
-                # Include adjacent columns for context
-                context_parts.append(f"{col}: {str(value)[:50]}")
+        def parts():
+            # Stop once the window is full so wide rows aren't formatted only to be cut off
+            length = -3  # no separator before the first part
+            for col, value in row_data.items():
+                if col == column_name:
+                    # Include the PII column
+                    part = f"{col}: {value}"
+                else:
+                    # Include adjacent columns for context
+                    part = f"{col}: {str(value)[:50]}"
+                yield part
+                length += len(part) + 3
+                if length >= window_chars:
+                    return
         
         # Join and limit length
-        context = " | ".join(context_parts)
-        
-        if len(context) > window_chars:
-            context = context[:window_chars]
-        
-        return context
+        return " | ".join(parts())[:window_chars]
     
     except Exception as e:
         return ""
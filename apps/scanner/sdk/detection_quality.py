@@ -10,11 +10,21 @@ Metrics Tracked:
 - Context quality scores
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 import json
+import math
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Percentiles reported for the confidence history
+CONFIDENCE_PERCENTILES = (50, 95, 99)
 
 
 @dataclass
@@ -28,9 +38,9 @@ class DetectionMetrics:
     context_rejected: int = 0
     
     # Per-PII-type metrics
-    detections_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
-    validations_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
-    rejections_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    detections_by_type: Counter = field(default_factory=Counter)
+    validations_by_type: Counter = field(default_factory=Counter)
+    rejections_by_type: Counter = field(default_factory=Counter)
     
     # Confidence distribution
     confidence_scores: List[float] = field(default_factory=list)
@@ -38,6 +48,18 @@ class DetectionMetrics:
     # Context quality
     context_adjustments: List[float] = field(default_factory=list)  # Confidence changes
     
+    # Record every score/adjustment; summaries only need the running totals
+    keep_history: bool = False
+    
+    def __post_init__(self):
+        # Running aggregates keep the summary getters O(1) on long scans
+        self._conf_n = len(self.confidence_scores)
+        self._conf_sum = sum(self.confidence_scores)
+        self._conf_min = min(self.confidence_scores, default=math.inf)
+        self._conf_max = max(self.confidence_scores, default=-math.inf)
+        self._adj_n = len(self.context_adjustments)
+        self._adj_sum = sum(self.context_adjustments)
+    
     def add_detection(self, pii_type: str):
         """Record a detection"""
         self.total_detections += 1
@@ -47,7 +69,12 @@ class DetectionMetrics:
         """Record a successful validation"""
         self.validated_findings += 1
         self.validations_by_type[pii_type] += 1
-        self.confidence_scores.append(confidence)
+        self._conf_n += 1
+        self._conf_sum += confidence
+        self._conf_min = min(self._conf_min, confidence)
+        self._conf_max = max(self._conf_max, confidence)
+        if self.keep_history:
+            self.confidence_scores.append(confidence)
     
     def add_rejection(self, pii_type: str, reason: str):
         """Record a rejection"""
@@ -62,7 +89,10 @@ class DetectionMetrics:
     def add_context_adjustment(self, base_confidence: float, adjusted_confidence: float):
         """Record a confidence adjustment"""
         adjustment = adjusted_confidence - base_confidence
-        self.context_adjustments.append(adjustment)
+        self._adj_n += 1
+        self._adj_sum += adjustment
+        if self.keep_history:
+            self.context_adjustments.append(adjustment)
     
     def get_validation_rate(self) -> float:
         """Get overall validation rate"""
@@ -84,18 +114,61 @@ class DetectionMetrics:
     
     def get_average_confidence(self) -> float:
         """Get average confidence score"""
-        if not self.confidence_scores:
-            return 0.0
-        return sum(self.confidence_scores) / len(self.confidence_scores)
+        return self._conf_sum / self._conf_n if self._conf_n else 0.0
+    
+    def get_confidence_range(self) -> Optional[Tuple[float, float]]:
+        """Get (min, max) confidence score, or None before any validation"""
+        return (self._conf_min, self._conf_max) if self._conf_n else None
+    
+    def get_confidence_percentiles(self) -> Optional[Dict[int, float]]:
+        """Get confidence percentiles, or None unless keep_history=True"""
+        scores = self.confidence_scores
+        if not scores:
+            return None
+        if NUMPY_AVAILABLE:
+            values = np.percentile(scores, CONFIDENCE_PERCENTILES)
+            return {p: float(v) for p, v in zip(CONFIDENCE_PERCENTILES, values)}
+        # Same linear interpolation as np.percentile's default
+        ordered = sorted(scores)
+        last = len(ordered) - 1
+        result = {}
+        for p in CONFIDENCE_PERCENTILES:
+            pos = last * p / 100
+            lo = int(pos)
+            hi = min(lo + 1, last)
+            result[p] = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+        return result
     
     def get_average_context_adjustment(self) -> float:
         """Get average context adjustment"""
-        if not self.context_adjustments:
-            return 0.0
-        return sum(self.context_adjustments) / len(self.context_adjustments)
+        return self._adj_sum / self._adj_n if self._adj_n else 0.0
+    
+    def get_context_adjustment_count(self) -> int:
+        """Get number of recorded context adjustments"""
+        return self._adj_n
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
+        confidence_range = self.get_confidence_range()
+        confidence = {
+            "average": f"{self.get_average_confidence():.2f}",
+            "min": f"{confidence_range[0]:.2f}" if confidence_range else "N/A",
+            "max": f"{confidence_range[1]:.2f}" if confidence_range else "N/A",
+        }
+        percentiles = self.get_confidence_percentiles()
+        if percentiles:
+            confidence.update({f"p{p}": f"{v:.2f}" for p, v in percentiles.items()})
+        
+        # Counters return 0 for types that were detected but never validated/rejected
+        validated, rejected = self.validations_by_type, self.rejections_by_type
+        by_pii_type = {}
+        for pii_type, detections in self.detections_by_type.items():
+            by_pii_type[pii_type] = {
+                "detections": detections,
+                "validated": validated[pii_type],
+                "rejected": rejected[pii_type],
+                "validation_rate": f"{validated[pii_type] / detections:.2%}" if detections > 0 else "N/A"
+            }
         return {
             "timestamp": self.timestamp.isoformat(),
             "summary": {
@@ -110,25 +183,12 @@ class DetectionMetrics:
                 "context_rejected": self.context_rejected,
                 "test_data_rate": f"{self.get_test_data_rate():.2%}",
             },
-            "confidence": {
-                "average": f"{self.get_average_confidence():.2f}",
-                "min": f"{min(self.confidence_scores):.2f}" if self.confidence_scores else "N/A",
-                "max": f"{max(self.confidence_scores):.2f}" if self.confidence_scores else "N/A",
-            },
+            "confidence": confidence,
             "context_adjustments": {
                 "average": f"{self.get_average_context_adjustment():.3f}",
-                "total_adjustments": len(self.context_adjustments),
+                "total_adjustments": self.get_context_adjustment_count(),
             },
-            "by_pii_type": {
-                pii_type: {
-                    "detections": self.detections_by_type[pii_type],
-                    "validated": self.validations_by_type[pii_type],
-                    "rejected": self.rejections_by_type[pii_type],
-                    "validation_rate": f"{self.validations_by_type[pii_type] / self.detections_by_type[pii_type]:.2%}"
-                        if self.detections_by_type[pii_type] > 0 else "N/A"
-                }
-                for pii_type in self.detections_by_type.keys()
-            }
+            "by_pii_type": by_pii_type,
         }
 
 
@@ -137,16 +197,18 @@ class DetectionQualityTracker:
     Tracks detection quality metrics over time.
     """
     
-    def __init__(self):
+    def __init__(self, keep_history: bool = False):
         self.current_metrics: Optional[DetectionMetrics] = None
         self.historical_metrics: List[DetectionMetrics] = []
+        # Passed to each run's DetectionMetrics; needed for confidence percentiles
+        self.keep_history = keep_history
     
     def start_new_run(self):
         """Start tracking a new detection run"""
         if self.current_metrics:
             self.historical_metrics.append(self.current_metrics)
         
-        self.current_metrics = DetectionMetrics(timestamp=datetime.now())
+        self.current_metrics = DetectionMetrics(timestamp=datetime.now(), keep_history=self.keep_history)
     
     def record_detection(self, pii_type: str):
         """Record a detection"""
@@ -218,12 +280,16 @@ class DetectionQualityTracker:
         
         print(f"\n📈 Confidence Scores:")
         print(f"  Average: {m.get_average_confidence():.2f}")
-        if m.confidence_scores:
-            print(f"  Range: {min(m.confidence_scores):.2f} - {max(m.confidence_scores):.2f}")
+        confidence_range = m.get_confidence_range()
+        if confidence_range:
+            print(f"  Range: {confidence_range[0]:.2f} - {confidence_range[1]:.2f}")
+        percentiles = m.get_confidence_percentiles()
+        if percentiles:
+            print("  Percentiles: " + ", ".join(f"p{p}={v:.2f}" for p, v in percentiles.items()))
         
         print(f"\n🎯 Context Adjustments:")
         print(f"  Average Adjustment: {m.get_average_context_adjustment():+.3f}")
-        print(f"  Total Adjustments: {len(m.context_adjustments)}")
+        print(f"  Total Adjustments: {m.get_context_adjustment_count()}")
         
         print(f"\n📋 By PII Type:")
         for pii_type in sorted(m.detections_by_type.keys()):
@@ -8,6 +8,7 @@ CRITICAL: Uses en_core_web_sm (Small) model to keep RAM under 1GB.
 """
 
 import os
+import threading
 import yaml
 from typing import Optional
 from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
@@ -22,6 +23,8 @@ class SharedAnalyzerEngine:
     
     _instance: Optional[AnalyzerEngine] = None
     _config = None
+    # Held while loading, so concurrent scans on a cold start load the model once
+    _lock = threading.Lock()
     
     @classmethod
     def get_engine(cls, config_path: str = None) -> AnalyzerEngine:
@@ -35,7 +38,9 @@ class SharedAnalyzerEngine:
             Configured AnalyzerEngine instance
         """
         if cls._instance is None:
-            cls._instance = cls._initialize_engine(config_path)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls._initialize_engine(config_path)
         return cls._instance
     
     @classmethod
@@ -177,6 +182,15 @@ class SharedAnalyzerEngine:
         """Reset the singleton (for testing)."""
         cls._instance = None
         cls._config = None
+    
+    @classmethod
+    def _after_fork(cls) -> None:
+        # A thread of the parent may have held the lock at fork time; the child gets a fresh one
+        cls._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=SharedAnalyzerEngine._after_fork)
 
 
 if __name__ == "__main__":
@@ -11,14 +11,30 @@ Supported Formats:
 """
 
 import os
+import re
 import shutil
 import csv
 import json
 import time
-from typing import List, Dict, Optional
+import tempfile
+import functools
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from sdk.masking.adapters.base import (
     BaseMaskingAdapter,
     MaskingFinding,
@@ -27,6 +43,68 @@ from sdk.masking.adapters.base import (
 )
 
 
+@contextmanager
+def _replace_atomically(file_path: str, mode: str = 'w', **open_kwargs):
+    """
+    Open a temp file next to file_path for writing, and move it over file_path
+    on success. Readers never see a half-written file, and a failure leaves
+    the original untouched.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".masking", dir=directory)
+    try:
+        with open(fd, mode, **open_kwargs) as f:
+            yield f
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _parse_csv_location(location: str) -> Optional[Tuple[int, str]]:
+    """Split a CSV location such as "row_5_column_email" into (5, "email")"""
+    parts = location.split('_')
+    if len(parts) < 4:
+        return None
+    return int(parts[1]), '_'.join(parts[3:])
+
+
+@functools.lru_cache(maxsize=10_000)
+def _compile_json_path(path: str) -> tuple:
+    """Tokenize a path such as "users[0].email" into ("users", 0, "email"), once per path"""
+    keys = path.replace('[', '.').replace(']', '').split('.')
+    return tuple(int(key) if key.isdigit() else key for key in keys)
+
+
+def _find_any(content: str, values: List[str]) -> Optional[str]:
+    """
+    Return one of values that occurs in content, or None, scanning content once
+    for all of them (Aho-Corasick when available, else a single regex alternation).
+    """
+    if not values:
+        return None
+    if '' in values:
+        # The empty string is in every text
+        return ''
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for value in values:
+            automaton.add_word(value, value)
+        automaton.make_automaton()
+        for _, value in automaton.iter(content):
+            return value
+        return None
+    # Longest first, so a value is not shadowed by one of its prefixes
+    pattern = re.compile('|'.join(map(re.escape, sorted(set(values), key=len, reverse=True))))
+    match = pattern.search(content)
+    return match.group(0) if match else None
+
+
+# 1 MiB file buffers: far fewer read/write syscalls than the 8 KiB default on large files
+IO_BUFFER_SIZE = 1 << 20
+
+
 class FilesystemMaskingAdapter(BaseMaskingAdapter):
     """
     Masks PII in filesystem files.
@@ -128,18 +206,22 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
                     error_message="Failed to create backup"
                 )
         
+        # The same value often recurs across rows; strategies are deterministic, so mask
+        # each (value, pii_type) once. Scoped to this file to bound memory
+        mask = functools.lru_cache(maxsize=100_000)(masking_strategy.mask)
+        
         # Route to format-specific masking
         try:
             if file_ext == '.csv':
-                result = self._mask_csv(findings, masking_strategy, source_location)
+                result = self._mask_csv(findings, mask, source_location)
             elif file_ext == '.json':
-                result = self._mask_json(findings, masking_strategy, source_location)
+                result = self._mask_json(findings, mask, source_location)
             elif file_ext in ['.txt', '.log', '.md']:
-                result = self._mask_text(findings, masking_strategy, source_location)
+                result = self._mask_text(findings, mask, source_location)
             else:
                 # Default to text-based masking
                 self._log(f"Unknown file type {file_ext}, using text-based masking", "WARNING")
-                result = self._mask_text(findings, masking_strategy, source_location)
+                result = self._mask_text(findings, mask, source_location)
             
             # Update result with backup location and duration
             result.backup_location = backup_location
@@ -162,7 +244,7 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
     def _mask_csv(
         self,
         findings: List[MaskingFinding],
-        masking_strategy,
+        mask,
         file_path: str
     ) -> MaskingResult:
         """Mask PII in CSV file"""
@@ -175,45 +257,42 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
                 failed_count=0
             )
         
-        # Group findings by location (row, column)
-        findings_by_location: Dict[str, List[MaskingFinding]] = {}
-        for finding in findings:
-            findings_by_location.setdefault(finding.location, []).append(finding)
-        
         masked_count = 0
         failed_count = 0
         
         try:
-            # Read CSV
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                fieldnames = reader.fieldnames
-            
-            # Apply masking
-            for location, location_findings in findings_by_location.items():
-                # Parse location (e.g., "row_5_column_email")
-                parts = location.split('_')
-                if len(parts) >= 4:
-                    row_idx = int(parts[1])
-                    column_name = '_'.join(parts[3:])
-                    
-                    if row_idx < len(rows) and column_name in rows[row_idx]:
-                        for finding in location_findings:
-                            try:
-                                # Apply masking strategy
-                                masked_value = masking_strategy.mask(finding.value, finding.pii_type)
-                                rows[row_idx][column_name] = masked_value
-                                masked_count += 1
-                            except Exception as e:
-                                self._log(f"Failed to mask finding: {e}", "ERROR")
-                                failed_count += 1
+            # Parse each location (e.g., "row_5_column_email") once and index findings by row, then column
+            findings_by_row: Dict[int, Dict[str, List[MaskingFinding]]] = {}
+            for finding in findings:
+                parsed = _parse_csv_location(finding.location)
+                if parsed:
+                    row_idx, column_name = parsed
+                    findings_by_row.setdefault(row_idx, {}).setdefault(column_name, []).append(finding)
             
-            # Write masked CSV
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+            # Stream rows from the original to a temp file: read, mask if targeted, write.
+            # Positional rows, since a dict per row is wasted on a few target cells
+            # The input is closed before the temp file is moved over it
+            with _replace_atomically(file_path, 'w', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as out, \
+                    open(file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                writer = csv.writer(out)
+                fieldnames = next(reader, [])
+                if fieldnames:
+                    writer.writerow(fieldnames)
+                col_idx = {name: i for i, name in enumerate(fieldnames)}
+                
+                row_idx = 0
+                for row in reader:
+                    # Skip blank lines, as DictReader did, so row_N indices keep their meaning
+                    if not row:
+                        continue
+                    row_findings = findings_by_row.get(row_idx)
+                    if row_findings:
+                        masked, failed = self._mask_csv_row(row, row_findings, col_idx, mask)
+                        masked_count += masked
+                        failed_count += failed
+                    writer.writerow(row)
+                    row_idx += 1
             
             self._log(f"Masked {masked_count}/{len(findings)} findings in CSV")
             
@@ -234,10 +313,37 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
                 error_message=str(e)
             )
     
+    def _mask_csv_row(
+        self,
+        row: List[str],
+        row_findings: Dict[str, List[MaskingFinding]],
+        col_idx: Dict[str, int],
+        mask
+    ) -> Tuple[int, int]:
+        """Mask one CSV row in place; returns (masked, failed) counts"""
+        masked_count = 0
+        failed_count = 0
+        for column_name, cell_findings in row_findings.items():
+            col = col_idx.get(column_name)
+            if col is None:
+                continue
+            if col >= len(row):
+                # Short row: DictReader would have filled the missing cells
+                row.extend([''] * (col + 1 - len(row)))
+            for finding in cell_findings:
+                try:
+                    # Apply masking strategy
+                    row[col] = mask(finding.value, finding.pii_type)
+                    masked_count += 1
+                except Exception as e:
+                    self._log(f"Failed to mask finding: {e}", "ERROR")
+                    failed_count += 1
+        return masked_count, failed_count
+    
     def _mask_json(
         self,
         findings: List[MaskingFinding],
-        masking_strategy,
+        mask,
         file_path: str
     ) -> MaskingResult:
         """Mask PII in JSON file"""
@@ -255,15 +361,14 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
         
         try:
             # Read JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data, use_orjson = self._load_json(file_path)
             
             # Apply masking
             for finding in findings:
                 try:
                     # Parse JSON path (e.g., "users[0].email")
                     path = finding.location
-                    masked_value = masking_strategy.mask(finding.value, finding.pii_type)
+                    masked_value = mask(finding.value, finding.pii_type)
                     
                     # Navigate to the value and replace it
                     self._set_json_value(data, path, masked_value)
@@ -274,8 +379,13 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
                     failed_count += 1
             
             # Write masked JSON
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if use_orjson:
+                # Same layout as json.dump(indent=2, ensure_ascii=False)
+                with _replace_atomically(file_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with _replace_atomically(file_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
             self._log(f"Masked {masked_count}/{len(findings)} findings in JSON")
             
@@ -299,7 +409,7 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
     def _mask_text(
         self,
         findings: List[MaskingFinding],
-        masking_strategy,
+        mask,
         file_path: str
     ) -> MaskingResult:
         """Mask PII in text file using position-based replacement"""
@@ -317,29 +427,39 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
         
         try:
             # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
                 content = f.read()
             
-            # Sort findings by position (descending) to avoid offset issues
+            # Sort findings by position so the file is rebuilt in one forward pass
             sorted_findings = sorted(
                 [f for f in findings if f.start_pos is not None and f.end_pos is not None],
-                key=lambda x: x.start_pos,
-                reverse=True
+                key=lambda x: x.start_pos
             )
             
-            # Apply masking from end to start
-            for finding in sorted_findings:
-                try:
-                    masked_value = masking_strategy.mask(finding.value, finding.pii_type)
-                    content = content[:finding.start_pos] + masked_value + content[finding.end_pos:]
+            # Stream unchanged slices and masked values straight to the output
+            # instead of rebuilding the whole string once per finding
+            with _replace_atomically(file_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as out:
+                cursor = 0
+                for finding in sorted_findings:
+                    if finding.start_pos < cursor:
+                        # Overlaps a span already replaced
+                        if finding.end_pos <= cursor:
+                            masked_count += 1
+                        else:
+                            self._log(f"Failed to mask finding: overlaps a previous finding at {finding.start_pos}", "ERROR")
+                            failed_count += 1
+                        continue
+                    try:
+                        masked_value = mask(finding.value, finding.pii_type)
+                    except Exception as e:
+                        self._log(f"Failed to mask finding: {e}", "ERROR")
+                        failed_count += 1
+                        continue
+                    out.write(content[cursor:finding.start_pos])
+                    out.write(masked_value)
+                    cursor = finding.end_pos
                     masked_count += 1
-                except Exception as e:
-                    self._log(f"Failed to mask finding: {e}", "ERROR")
-                    failed_count += 1
-            
-            # Write masked content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                out.write(content[cursor:])
             
             self._log(f"Masked {masked_count}/{len(findings)} findings in text file")
             
@@ -360,24 +480,35 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
                 error_message=str(e)
             )
     
+    def _load_json(self, file_path: str):
+        """
+        Parse a JSON file, with orjson when available.
+        
+        Returns:
+            (data, whether orjson parsed it, and so can also write it back)
+        """
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw), True
+            except orjson.JSONDecodeError:
+                # NaN/Infinity or integers beyond 64 bits, which only the stdlib accepts
+                return json.loads(raw.decode('utf-8')), False
+        with open(file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            return json.load(f), False
+    
     def _set_json_value(self, data, path: str, value):
         """Set value in JSON data using path notation"""
         # Simple implementation for basic paths
         # TODO: Implement full JSONPath support for complex paths
-        keys = path.replace('[', '.').replace(']', '').split('.')
+        keys = _compile_json_path(path)
         current = data
         
         for key in keys[:-1]:
-            if key.isdigit():
-                current = current[int(key)]
-            else:
-                current = current[key]
+            current = current[key]
         
-        final_key = keys[-1]
-        if final_key.isdigit():
-            current[int(final_key)] = value
-        else:
-            current[final_key] = value
+        current[keys[-1]] = value
     
     def rollback(self, backup_location: str, target_location: str) -> bool:
         """
@@ -414,14 +545,14 @@ class FilesystemMaskingAdapter(BaseMaskingAdapter):
             True if all PII values are masked
         """
         try:
-            with open(source_location, 'r', encoding='utf-8') as f:
+            with open(source_location, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
                 content = f.read()
             
-            # Check if any original PII values still exist
-            for finding in findings:
-                if finding.value in content:
-                    self._log(f"Verification failed: Found unmasked value: {finding.value[:10]}***", "ERROR")
-                    return False
+            # Check if any original PII values still exist, in one pass over the content
+            leaked = _find_any(content, [finding.value for finding in findings])
+            if leaked is not None:
+                self._log(f"Verification failed: Found unmasked value: {leaked[:10]}***", "ERROR")
+                return False
             
             self._log("Verification passed: All PII values masked")
             return True
@@ -4,8 +4,8 @@ Validators Package
 Mathematical validation functions for PII types.
 """
 
-from .verhoeff import Verhoeff, validate_aadhaar
-from .luhn import Luhn, validate_credit_card
+from .verhoeff import Verhoeff, validate_aadhaar, validate_aadhaar_batch
+from .luhn import Luhn, validate_credit_card, validate_credit_card_batch
 from .dummy_detector import is_dummy_data
 from .pan import validate_pan
 from .email import validate_email
@@ -16,7 +16,9 @@ __all__ = [
     'Verhoeff',
     'Luhn',
     'validate_aadhaar',
+    'validate_aadhaar_batch',
     'validate_credit_card',
+    'validate_credit_card_batch',
     'is_dummy_data',
     'validate_pan',
     'validate_email',
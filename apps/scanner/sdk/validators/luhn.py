@@ -4,6 +4,20 @@ Luhn Algorithm - Credit Card Validator
 The Luhn algorithm (mod 10) is used to validate credit card numbers.
 """
 
+from typing import List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 class Luhn:
     """Luhn algorithm implementation for credit card validation."""
@@ -92,6 +106,92 @@ def validate_credit_card(number: str) -> bool:
     return Luhn.validate(clean)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _luhn_batch_kernel(buf, offsets):
+        n = offsets.size - 1
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            parity = (end - start) % 2
+            total = 0
+            for j in range(start, end):
+                d = buf[j] - 48
+                # Double every second digit
+                if (j - start) % 2 == parity:
+                    d *= 2
+                    if d > 9:
+                        d -= 9
+                total += d
+            out[i] = total % 10 == 0
+        return out
+
+
+def luhn_validate_batch(candidates: List[str]) -> "np.ndarray":
+    """
+    Validates many ASCII digit strings at once using Luhn algorithm.
+    
+    Args:
+        candidates: Strings of ASCII digits, any mix of lengths
+        
+    Returns:
+        (N,) bool array, True where the checksum is valid
+    """
+    lengths = np.fromiter(map(len, candidates), dtype=np.int64, count=len(candidates))
+    buf = np.frombuffer(''.join(candidates).encode('ascii'), dtype=np.uint8)
+    if NUMBA_AVAILABLE:
+        offsets = np.zeros(len(candidates) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return _luhn_batch_kernel(buf, offsets)
+    
+    # Vectorize across rows of equal length: one weighted sum per length group
+    out = np.empty(len(candidates), dtype=np.bool_)
+    starts = np.cumsum(lengths) - lengths
+    for width in np.unique(lengths):
+        rows = np.flatnonzero(lengths == width)
+        digits = buf[starts[rows, None] + np.arange(width)].astype(np.int64) - 48
+        doubled = (np.arange(width) % 2) == (width % 2)
+        digits[:, doubled] *= 2
+        digits[digits > 9] -= 9
+        out[rows] = digits.sum(axis=1) % 10 == 0
+    return out
+
+
+def validate_credit_card_batch(numbers: List[str]) -> List[bool]:
+    """
+    Validates many credit card numbers with a single Luhn batch pass.
+    
+    Applies the same rules as validate_credit_card().
+    
+    Args:
+        numbers: Credit card number strings (may contain spaces/hyphens)
+        
+    Returns:
+        List of validation results, in input order
+    """
+    results = [False] * len(numbers)
+    candidates = []
+    indices = []
+    
+    for idx, number in enumerate(numbers):
+        clean = ''.join(c for c in number if c.isdigit())
+        if len(clean) < 13 or len(clean) > 19:
+            continue
+        if NUMPY_AVAILABLE and clean.isascii():
+            candidates.append(clean)
+            indices.append(idx)
+        else:
+            # Non-ASCII digits (e.g. Devanagari) go through the scalar path
+            results[idx] = Luhn.validate(clean)
+    
+    if candidates:
+        for idx, is_valid in zip(indices, luhn_validate_batch(candidates).tolist()):
+            results[idx] = is_valid
+    
+    return results
+
+
 if __name__ == "__main__":
     print("=== Luhn Algorithm Tests ===\n")
     
@@ -9,6 +9,20 @@ It uses dihedral group D5 mathematics for checksum calculation.
 Reference: Jacobus Verhoeff (1969)
 """
 
+from typing import List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 class Verhoeff:
     """Verhoeff checksum algorithm implementation for Aadhaar validation."""
@@ -90,6 +104,48 @@ class Verhoeff:
         return str(cls.inv[checksum])
 
 
+if NUMPY_AVAILABLE:
+    # Flat uint8 tables: _MULT[checksum*10 + p], _PERM[(i&7)*10 + d]
+    _MULT = np.array(Verhoeff.d, dtype=np.uint8).ravel()
+    _PERM = np.array(Verhoeff.p, dtype=np.uint8).ravel()
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _verhoeff_batch_kernel(digits, mult, perm):
+        n, width = digits.shape
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            checksum = 0
+            for j in range(width):
+                checksum = mult[checksum * 10 + perm[(j & 7) * 10 + digits[i, width - 1 - j]]]
+            out[i] = checksum == 0
+        return out
+
+
+def verhoeff_validate_batch(digits: "np.ndarray") -> "np.ndarray":
+    """
+    Validates many digit strings at once using Verhoeff algorithm.
+    
+    Args:
+        digits: (N, W) uint8 array of digit values (0-9), one candidate per row
+        
+    Returns:
+        (N,) bool array, True where the row's checksum is valid
+    """
+    digits = np.ascontiguousarray(digits, dtype=np.uint8)
+    if NUMBA_AVAILABLE:
+        return _verhoeff_batch_kernel(digits, _MULT, _PERM)
+    
+    # Vectorize across rows instead: one table lookup per digit position
+    mult = _MULT.reshape(10, 10)
+    perm = _PERM.reshape(8, 10)
+    width = digits.shape[1]
+    checksum = np.zeros(len(digits), dtype=np.uint8)
+    for j in range(width):
+        checksum = mult[checksum, perm[j & 7, digits[:, width - 1 - j]]]
+    return checksum == 0
+
+
 # Standalone validation functions for convenience
 def validate_aadhaar(number: str) -> bool:
     """
@@ -116,6 +172,49 @@ def validate_aadhaar(number: str) -> bool:
     return Verhoeff.validate(clean)
 
 
+def validate_aadhaar_batch(numbers: List[str]) -> List[bool]:
+    """
+    Validates many Aadhaar numbers with a single Verhoeff batch pass.
+    
+    Applies the same rules as validate_aadhaar().
+    
+    Args:
+        numbers: Aadhaar number strings (may contain spaces/hyphens)
+        
+    Returns:
+        List of validation results, in input order
+    """
+    results = [False] * len(numbers)
+    candidates = []
+    indices = []
+    
+    for idx, number in enumerate(numbers):
+        clean = ''.join(c for c in number if c.isdigit())
+        if len(clean) != 12 or clean[0] in ['0', '1']:
+            continue
+        if clean.isascii():
+            candidates.append(clean)
+            indices.append(idx)
+        else:
+            # Non-ASCII digits (e.g. Devanagari) go through the scalar path
+            results[idx] = Verhoeff.validate(clean)
+    
+    if not candidates:
+        return results
+    
+    if not NUMPY_AVAILABLE:
+        for idx, clean in zip(indices, candidates):
+            results[idx] = Verhoeff.validate(clean)
+        return results
+    
+    digits = np.frombuffer(''.join(candidates).encode('ascii'), dtype=np.uint8).reshape(-1, 12) - 48
+    mask = verhoeff_validate_batch(digits)
+    for idx, is_valid in zip(indices, mask):
+        results[idx] = bool(is_valid)
+    
+    return results
+
+
 if __name__ == "__main__":
     # Test cases
     print("=== Verhoeff Algorithm Tests ===\n")
@@ -0,0 +1,105 @@
+import csv
+import pytest
+from sdk.masking.adapters.base import MaskingFinding, MaskingStatus
+from sdk.masking.adapters.filesystem import FilesystemMaskingAdapter
+from sdk.masking.strategies import RedactStrategy
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(rows)
+
+
+def _read_csv(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+def _mask(path, findings):
+    adapter = FilesystemMaskingAdapter(backup_enabled=False)
+    return adapter.mask_findings(findings, RedactStrategy(), str(path))
+
+
+def test_csv_findings_masked_by_row_and_column(tmp_path):
+    path = tmp_path / 'people.csv'
+    _write_csv(path, [
+        ['id', 'email', 'first_name'],
+        ['1', 'a@x.com', 'Asha'],
+        ['2', 'b@x.com', 'Ravi'],
+        ['3', 'c@x.com', 'Meena'],
+    ])
+
+    result = _mask(path, [
+        MaskingFinding('a@x.com', 'EMAIL_ADDRESS', 'row_0_column_email'),
+        MaskingFinding('Meena', 'PERSON', 'row_2_column_first_name'),
+        MaskingFinding('c@x.com', 'EMAIL_ADDRESS', 'row_2_column_email'),
+    ])
+
+    assert result.status == MaskingStatus.COMPLETED
+    assert result.masked_count == 3
+    assert _read_csv(path) == [
+        ['id', 'email', 'first_name'],
+        ['1', '[REDACTED]', 'Asha'],
+        ['2', 'b@x.com', 'Ravi'],
+        ['3', '[REDACTED]', '[REDACTED]'],
+    ]
+
+
+@pytest.mark.parametrize('location', ['row_0_column_phone', 'row_9_column_email', 'email'])
+def test_csv_findings_that_match_no_cell_leave_file_unchanged(tmp_path, location):
+    path = tmp_path / 'people.csv'
+    rows = [['id', 'email'], ['1', 'a@x.com']]
+    _write_csv(path, rows)
+
+    result = _mask(path, [MaskingFinding('a@x.com', 'EMAIL_ADDRESS', location)])
+
+    assert result.masked_count == 0
+    assert _read_csv(path) == rows
+
+
+def test_csv_streaming_keeps_row_indices_and_quoting(tmp_path):
+    path = tmp_path / 'notes.csv'
+    path.write_text(
+        'id,email,note\n'
+        '1,a@x.com,"hello, world"\n'
+        '\n'
+        '2,b@x.com,"line one\nline two"\n'
+        '3\n',
+        encoding='utf-8',
+    )
+
+    result = _mask(path, [
+        MaskingFinding('b@x.com', 'EMAIL_ADDRESS', 'row_1_column_email'),
+        MaskingFinding('x', 'EMAIL_ADDRESS', 'row_2_column_email'),
+    ])
+
+    assert result.masked_count == 2
+    # Blank lines are dropped without shifting row_N; short rows are padded to the target cell
+    assert _read_csv(path) == [
+        ['id', 'email', 'note'],
+        ['1', 'a@x.com', 'hello, world'],
+        ['2', '[REDACTED]', 'line one\nline two'],
+        ['3', '[REDACTED]'],
+    ]
+
+
+def test_csv_masking_preserves_file_mode(tmp_path):
+    path = tmp_path / 'people.csv'
+    _write_csv(path, [['email'], ['a@x.com']])
+    path.chmod(0o640)
+
+    _mask(path, [MaskingFinding('a@x.com', 'EMAIL_ADDRESS', 'row_0_column_email')])
+
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_failed_csv_masking_leaves_original_untouched(tmp_path):
+    path = tmp_path / 'people.csv'
+    original = b'email\na@x.com\n\xff\xfe\n'
+    path.write_bytes(original)
+
+    result = _mask(path, [MaskingFinding('a@x.com', 'EMAIL_ADDRESS', 'row_0_column_email')])
+
+    assert result.status == MaskingStatus.FAILED
+    assert path.read_bytes() == original
+    assert [p.name for p in tmp_path.iterdir()] == ['people.csv']
@@ -0,0 +1,52 @@
+import re
+import pytest
+from hawk_scanner.commands.postgresql import _to_postgres_regex, build_pushdown_regex
+
+AADHAAR = r"\b\d{4}[-.]?\d{4}[-.]?\d{4}\b"
+
+
+def _as_python(pg_regex):
+    # The translated subset is also valid Python syntax once (?n) is dropped
+    return re.compile(pg_regex.removeprefix('(?n)'), re.IGNORECASE)
+
+
+def test_digit_class_spelled_out_as_unicode_ranges():
+    translated = _to_postgres_regex(AADHAAR)
+    assert '\\d' not in translated and '\\b' not in translated
+    # Devanagari digits match Python's \d, so the filter must keep them
+    assert _as_python(translated).search('९९९९११११२२२१')
+    assert _as_python(translated).search('2341-2341-2346')
+
+
+def test_space_class_inside_brackets():
+    translated = _to_postgres_regex(r"[^/\s:@]{3}[\s.-]x")
+    assert '\\s' not in translated
+    assert _as_python(translated).search('abc\u00a0x')
+    assert not _as_python(translated).search('a b\u00a0x')
+
+
+def test_negated_classes_and_word_escapes():
+    digits = _to_postgres_regex(r"\d")[1:-1]
+    spaces = _to_postgres_regex(r"\s")[1:-1]
+    assert _to_postgres_regex(r"\D\w\W\S") == f"[^{digits}]..[^{spaces}]"
+
+
+@pytest.mark.parametrize('regex', [r"(?P<x>\d)", r"a(?i)b", r"[\w.]+", r"[^\D]"])
+def test_untranslatable_patterns(regex):
+    assert _to_postgres_regex(regex) is None
+    assert build_pushdown_regex({'ok': 'abc', 'bad': regex}) is None
+
+
+def test_escaped_backslash_and_literal_bracket():
+    assert _to_postgres_regex(r"\\b[]\d]") == '\\\\b[]' + _to_postgres_regex(r"\d")[1:-1] + ']'
+
+
+@pytest.mark.parametrize('text', ['९९९९११११२२२१', 'id 234123412346', 'a@b.co', '(+91 )987 654 3210'])
+def test_filter_keeps_rows_python_flags(text):
+    patterns = {
+        'Aadhar': AADHAAR,
+        'Email': r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
+        'Phone Number': r"^\(\+\d{1,2}\s\)?\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}$",
+    }
+    assert any(re.search(regex, text) for regex in patterns.values())
+    assert _as_python(build_pushdown_regex(patterns)).search(text)
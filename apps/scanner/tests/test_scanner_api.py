@@ -0,0 +1,110 @@
+import concurrent.futures
+import pytest
+import scanner_api
+
+
+def _fs_finding(i):
+    return {'pattern_name': 'Email', 'file_path': f'/data/{i}.txt', 'sample_text': f'user{i}@example.com'}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """scanner_api with its own ingest pool, a clean scan table and no network."""
+    ingest_exec = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(scanner_api, 'INGEST_EXEC', ingest_exec)
+    monkeypatch.setattr(scanner_api, 'active_scans', scanner_api.OrderedDict())
+    posted = []
+    monkeypatch.setattr(scanner_api, 'post_findings', lambda scan_id, batch: posted.append((scan_id, list(batch))))
+    completed = []
+    monkeypatch.setattr(scanner_api.SESSION, 'post', lambda url, **kwargs: completed.append(url))
+
+    def run(scan_id, config):
+        scanner_api.active_scans[scan_id] = {'status': 'running', 'config': config}
+        scanner_api.execute_scan(scan_id, config)
+        # Wait for the scan's ingest consumer
+        ingest_exec.shutdown(wait=True)
+        return scanner_api.active_scans[scan_id]
+
+    run.posted = posted
+    run.completed = completed
+    yield run
+    ingest_exec.shutdown(wait=True)
+
+
+def test_scan_runs_in_process_under_the_deadline(api, monkeypatch):
+    calls = []
+
+    def scan_iter(connections, timeout=None):
+        calls.append((connections, timeout))
+        return (_fs_finding(i) for i in range(3))
+
+    monkeypatch.setattr(scanner_api.hawk_fs, 'scan_iter', scan_iter)
+
+    scan = api('scan-1', {'sources': ['/data', '/srv']})
+
+    assert scan['status'] == 'completed'
+    connections, timeout = calls[0]
+    assert connections['sources']['fs'] == {
+        'scan_scan-1_source_0': {'path': '/data'},
+        'scan_scan-1_source_1': {'path': '/srv'},
+    }
+    assert timeout == scanner_api.SCAN_TIMEOUT
+    assert api.posted[0][1][0]['source']['path'] == '/data/0.txt'
+    assert api.completed == [f'{scanner_api.BACKEND_URL}/api/v1/scans/scan-1/complete']
+
+
+def test_timed_out_scan_is_failed_not_completed(api, monkeypatch):
+    def scan_iter(connections, timeout=None):
+        yield _fs_finding(0)
+        raise TimeoutError('fs scan exceeded its 600s time limit')
+
+    monkeypatch.setattr(scanner_api.hawk_fs, 'scan_iter', scan_iter)
+
+    scan = api('scan-2', {'sources': ['/data']})
+
+    assert scan['status'] == 'failed'
+    assert 'time limit' in scan['error']
+    # Findings from before the timeout are dropped with the failed scan
+    assert api.posted == []
+    assert api.completed == []
+
+
+def test_status_reports_queued_scans(monkeypatch):
+    monkeypatch.setattr(scanner_api, 'active_scans', scanner_api.OrderedDict(x={'status': 'running'}))
+    pending = concurrent.futures.Future()
+    monkeypatch.setitem(scanner_api.scan_futures, 'x', pending)
+    client = scanner_api.app.test_client()
+
+    assert client.get('/scan/x/status').get_json() == {'status': 'running', 'queued': True}
+    pending.set_running_or_notify_cancel()
+    assert client.get('/scan/x/status').get_json()['queued'] is False
+    assert client.get('/scan/missing/status').status_code == 404
+
+
+def test_findings_are_ingested_in_batches(api, monkeypatch):
+    monkeypatch.setattr(scanner_api.hawk_fs, 'scan_iter', lambda connections, timeout=None: map(_fs_finding, range(5)))
+    monkeypatch.setattr(scanner_api, 'INGEST_BATCH_SIZE', 2)
+
+    api('scan-3', {'sources': ['/data']})
+
+    assert [len(batch) for _, batch in api.posted] == [2, 2, 1]
+    assert [f['source']['path'] for _, batch in api.posted for f in batch] == [f'/data/{i}.txt' for i in range(5)]
+
+
+def test_unbatched_ingest_sends_one_request(api, monkeypatch):
+    monkeypatch.setattr(scanner_api.hawk_fs, 'scan_iter', lambda connections, timeout=None: map(_fs_finding, range(3)))
+    monkeypatch.setattr(scanner_api, 'INGEST_BATCH_SIZE', 0)
+
+    api('scan-4', {'sources': ['/data']})
+
+    assert [len(batch) for _, batch in api.posted] == [3]
+
+
+def test_empty_scan_completes_without_posting_findings(api, monkeypatch):
+    monkeypatch.setattr(scanner_api.hawk_fs, 'scan_iter', lambda connections, timeout=None: iter(()))
+
+    scan = api('scan-5', {'sources': ['/data']})
+
+    assert scan['status'] == 'completed'
+    assert api.posted == []
+    assert len(api.completed) == 1
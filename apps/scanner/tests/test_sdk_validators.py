@@ -9,14 +9,27 @@ Target: 95%+ precision on Phase 1 PII types
 import sys
 import os
 import yaml
+import pytest
 from pathlib import Path
 
 # Add scanner to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sdk.validators import Verhoeff, Luhn, is_dummy_data
+from sdk.validators import Verhoeff, Luhn, is_dummy_data, validate_aadhaar, validate_aadhaar_batch
+from sdk.validators import validate_credit_card, validate_credit_card_batch
 from sdk.engine import SharedAnalyzerEngine
 from sdk.recognizers import AadhaarRecognizer, PANRecognizer, CreditCardRecognizer
+from sdk.validators import verhoeff, luhn
+
+
+# Batch validators pick a backend from these flags at call time
+BATCH_BACKENDS = [
+    pytest.param({'NUMBA_AVAILABLE': True}, id='numba',
+                 marks=pytest.mark.skipif(not verhoeff.NUMBA_AVAILABLE, reason='numba not installed')),
+    pytest.param({'NUMBA_AVAILABLE': False}, id='numpy',
+                 marks=pytest.mark.skipif(not verhoeff.NUMPY_AVAILABLE, reason='numpy not installed')),
+    pytest.param({'NUMBA_AVAILABLE': False, 'NUMPY_AVAILABLE': False}, id='python'),
+]
 
 
 class TestResults:
@@ -104,6 +117,57 @@ def test_verhoeff_algorithm():
     return results
 
 
+def test_verhoeff_batch():
+    """Test batch Aadhaar validation agrees with per-number validation."""
+    print("\n[TEST] Verhoeff Batch Validation")
+    results = TestResults()
+    
+    numbers = [
+        "234567890126",
+        "999911112226",
+        "9999 1111 2221",
+        "111111111111",
+        "999911112222",
+        "012345678901",
+        "12345",
+    ]
+    
+    batch = validate_aadhaar_batch(numbers)
+    for number, result in zip(numbers, batch):
+        expected = validate_aadhaar(number)
+        if result == expected:
+            results.add_pass()
+            print(f"  ✓ {number}: {result}")
+        else:
+            results.add_fail(f"Batch({number})", expected, result)
+            print(f"  ✗ Failed: {number}")
+    
+    return results
+
+
+AADHAAR_BATCH_CASES = [
+    "234567890126",
+    "999911112226",
+    "999911112221",
+    "9999 1111 2221",
+    "2341-2341-2346",
+    "111111111111",
+    "999911112222",
+    "012345678901",
+    "12345",
+    "९९९९११११२२२१",
+    "",
+]
+
+
+@pytest.mark.parametrize('backend', BATCH_BACKENDS)
+def test_aadhaar_batch_matches_scalar(backend, monkeypatch):
+    for flag, value in backend.items():
+        monkeypatch.setattr(verhoeff, flag, value)
+    
+    assert validate_aadhaar_batch(AADHAAR_BATCH_CASES) == [validate_aadhaar(n) for n in AADHAAR_BATCH_CASES]
+
+
 def test_luhn_algorithm():
     """Test Luhn implementation."""
     print("\n[TEST] Luhn Algorithm")
@@ -140,6 +204,58 @@ def test_luhn_algorithm():
     return results
 
 
+def test_luhn_batch():
+    """Test batch credit card validation agrees with per-number validation."""
+    print("\n[TEST] Luhn Batch Validation")
+    results = TestResults()
+    
+    numbers = [
+        "4532015112830366",
+        "6011514433546201",
+        "4532 0151 1283 0366",
+        "4532015112830367",
+        "1111111111111111",
+        "378282246310005",
+        "4532015112",
+        "45320151128303661234",
+    ]
+    
+    batch = validate_credit_card_batch(numbers)
+    for number, result in zip(numbers, batch):
+        expected = validate_credit_card(number)
+        if result == expected:
+            results.add_pass()
+            print(f"  ✓ {number}: {result}")
+        else:
+            results.add_fail(f"Batch({number})", expected, result)
+            print(f"  ✗ Failed: {number}")
+    
+    return results
+
+
+CREDIT_CARD_BATCH_CASES = [
+    "4532015112830366",
+    "6011514433546201",
+    "4532 0151 1283 0366",
+    "4532-0151-1283-0366",
+    "4532015112830367",
+    "1111111111111111",
+    "378282246310005",
+    "4532015112",
+    "45320151128303661234",
+    "४५३२०१५११२८३०३६६",
+    "",
+]
+
+
+@pytest.mark.parametrize('backend', BATCH_BACKENDS)
+def test_credit_card_batch_matches_scalar(backend, monkeypatch):
+    for flag, value in backend.items():
+        monkeypatch.setattr(luhn, flag, value)
+    
+    assert validate_credit_card_batch(CREDIT_CARD_BATCH_CASES) == [validate_credit_card(n) for n in CREDIT_CARD_BATCH_CASES]
+
+
 def test_dummy_detector():
     """Test dummy data detection."""
     print("\n[TEST] Dummy Data Detector")
@@ -238,7 +354,9 @@ def run_all_tests():
     # Run individual test suites
     test_suites = [
         test_verhoeff_algorithm,
+        test_verhoeff_batch,
         test_luhn_algorithm,
+        test_luhn_batch,
         test_dummy_detector,
         test_ground_truth_data,
     ]
@@ -1,9 +1,14 @@
 import pytest
-from hawk_scanner.internals.validation_integration import validate_findings
+from hawk_scanner.internals.validation_integration import validate_findings, validate_matches
 
 def test_validate_findings():
     matches = [{'pattern_name': 'EMAIL', 'matches': ['test@example.com'], 'sample_text': 'test@example.com'}]
     args = type('Args', (), {'verbose': False})()
     validated = validate_findings(matches, args)
     assert len(validated) == 1
-    assert validated[0]['pattern_name'] == 'EMAIL'
\ No newline at end of file
+    assert validated[0]['pattern_name'] == 'EMAIL'
+
+def test_email_format_validation_not_skipped():
+    # The fingerprint Email regex accepts these; only the validator rejects them
+    results = validate_matches(['a..b@x.com', '.a@x.com', 'john.doe@company.co.in'], 'Email')
+    assert [is_valid for is_valid, _ in results] == [False, False, True]